@@ -5,13 +5,149 @@ Simple Hugging Face browser helper.
 Provides search, list files and download helpers with best-effort mirror support.
 This is intentionally lightweight and uses the public HF API endpoints.
 """
+import os
+import json
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.hf_cache import cached
+
+# orjson is optional; it decodes large API payloads (siblings/tags lists) much faster
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except Exception:
+    _loads = json.loads
+
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
 
 HF_API_BASE = "https://huggingface.co/api"
 
 
+def _create_session(retry: bool = True) -> requests.Session:
+    """Create the pooled session shared by all helpers.
+
+    Keep-alive connections are reused across calls so consecutive API requests
+    to the same host skip the TCP/TLS handshake. With retry=False every request
+    is a single attempt, so its timeout bounds the whole call.
+    """
+    session = requests.Session()
+    max_retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]) if retry else 0
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_SESSION = _create_session()
+# mirror probes must fail fast: a retried probe turns a dead endpoint into seconds of waiting
+_PROBE_SESSION = _create_session(retry=False)
+
+
+# --- file classification -----------------------------------------------------
+# Lookup tables and the model-type regex are built once at import time; the
+# predicates below run for every file of a repo listing.
+
+# Model-type rules: a dict keyed by extension resolves most names with one
+# lookup; only the few keyword rules (diffusion/lora/ggml/model) need a
+# substring test, and those run in C via `in`.
+_MODEL_EXT_TYPES = {
+    '.safetensors': 'safetensors',
+    '.pt': 'pytorch',
+    '.pth': 'pytorch',
+    '.ckpt': 'pytorch',
+    '.h5': 'tensorflow',
+    '.pb': 'tensorflow',
+    '.keras': 'tensorflow',
+    '.tflite': 'tflite',
+    '.onnx': 'onnx',
+    '.msgpack': 'flax',
+    '.gguf': 'ggml',
+    '.ggml': 'ggml',
+}
+_LORA_EXTS = frozenset({'.safetensors', '.bin', '.pt', '.pth'})
+
+_CONFIG_SUFFIXES = frozenset({'.yaml', '.yml', '.toml', '.cfg', '.ini'})
+_CONFIG_EXACT_NAMES = frozenset({'model_index.json', 'tokenizer.json', 'special_tokens_map.json', 'vocab.json'})
+_DOC_SUFFIXES = frozenset({'.md', '.rst'})
+_DOC_STEMS = frozenset({'readme', 'license', 'licence', 'changelog', 'contributing', 'notice', 'authors', 'copying', 'citation'})
+_DOC_STEM_SUFFIXES = frozenset({'', '.txt', '.md', '.rst'})
+_CODE_SUFFIXES = frozenset({'.py', '.sh', '.ipynb', '.js', '.ts', '.c', '.cc', '.cpp', '.h', '.hpp', '.bat', '.ps1'})
+
+
+def _split_name(filename: str):
+    """Return (lowercased basename, stem, suffix) for a repo file path."""
+    name = filename.rsplit('/', 1)[-1].lower()
+    stem, dot, ext = name.rpartition('.')
+    if not dot or not stem:
+        return name, name, ''
+    return name, stem, '.' + ext
+
+
+@functools.lru_cache(maxsize=4096)
+def _model_type_of(name: str) -> Optional[str]:
+    """Model type for a lowercased basename, or None. Rules are checked most specific first."""
+    if 'diffusion_pytorch' in name:
+        return 'diffusion_pytorch'
+    dot = name.rfind('.')
+    if dot < 0:
+        return None
+    stem, suffix = name[:dot], name[dot:]
+    if suffix in _LORA_EXTS and 'lora' in stem:
+        return 'lora'
+    if suffix == '.bin':
+        if 'ggml' in stem:
+            return 'ggml'
+        return 'pytorch' if 'model' in stem else None
+    return _MODEL_EXT_TYPES.get(suffix)
+
+
+def _detect_model_type(filename: str) -> str:
+    """Classify a weights file by framework/format, or 'unknown' if it is not one."""
+    return _model_type_of(filename.rsplit('/', 1)[-1].lower()) or 'unknown'
+
+
+def _is_model_file(filename: str) -> bool:
+    return _model_type_of(filename.rsplit('/', 1)[-1].lower()) is not None
+
+
+def _is_config_file(filename: str) -> bool:
+    name, stem, suffix = _split_name(filename)
+    if suffix in _CONFIG_SUFFIXES or name in _CONFIG_EXACT_NAMES:
+        return True
+    return suffix == '.json' and 'config' in stem
+
+
+def _is_documentation_file(filename: str) -> bool:
+    name, stem, suffix = _split_name(filename)
+    return suffix in _DOC_SUFFIXES or (stem in _DOC_STEMS and suffix in _DOC_STEM_SUFFIXES)
+
+
+def _categorize_file(filename: str) -> str:
+    """Return one of 'model', 'config', 'documentation', 'code' or 'other'."""
+    if _is_model_file(filename):
+        return 'model'
+    if _is_config_file(filename):
+        return 'config'
+    if _is_documentation_file(filename):
+        return 'documentation'
+    if _split_name(filename)[2] in _CODE_SUFFIXES:
+        return 'code'
+    return 'other'
+
+
+@cached(ttl=3600)
 def search_models(query: str, limit: int = 20, api_base: Optional[str] = None) -> List[Dict]:
     """Search models. api_base can override the HF API base (e.g. a mirror).
 
@@ -20,13 +156,14 @@ def search_models(query: str, limit: int = 20, api_base: Optional[str] = None) -
     try:
         base = api_base.rstrip('/') if api_base else HF_API_BASE
         params = {'search': query, 'limit': limit}
-        r = requests.get(f"{base}/models", params=params, timeout=15)
+        r = _SESSION.get(f"{base}/models", params=params, timeout=15)
         r.raise_for_status()
-        return r.json() or []
+        return _loads(r.content) or []
     except Exception:
         return []
 
 
+@cached(ttl=3600)
 def list_model_files(repo_id: str, api_base: Optional[str] = None) -> List[Dict]:
     """List files in a model repo.
 
@@ -34,12 +171,12 @@ def list_model_files(repo_id: str, api_base: Optional[str] = None) -> List[Dict]
     """
     try:
         base = api_base.rstrip('/') if api_base else HF_API_BASE
-        r = requests.get(f"{base}/models/{repo_id}/files", timeout=15)
+        r = _SESSION.get(f"{base}/models/{repo_id}/files", timeout=15)
         # if endpoint not found (some mirrors may not implement), fall through to probing
         if r.status_code == 404:
             raise FileNotFoundError()
         r.raise_for_status()
-        data = r.json() or []
+        data = _loads(r.content) or []
         files = []
         for it in data:
             # the HF files endpoint sometimes returns plain filenames or dicts
@@ -54,84 +191,103 @@ def list_model_files(repo_id: str, api_base: Optional[str] = None) -> List[Dict]
             files.append({"name": name, "size": size, "type": ftype})
         return files
     except FileNotFoundError:
-        # fallback: attempt to probe a list of common filenames via HEAD/GET
-        common = [
-            'README.md', 'README', 'config.json', 'model_index.json', 'pytorch_model.bin',
-            'tf_model.h5', 'flax_model.msgpack', 'adapter_config.json'
-        ]
-        found = []
-        # determine download base for raw file access
-        raw_base = "https://huggingface.co"
-        if api_base and isinstance(api_base, str) and api_base.startswith('http'):
-            # if api_base is a mirror and ends with /api, remove the /api part to form raw base
-            raw_base = api_base.rstrip('/')
-            if raw_base.endswith('/api'):
-                raw_base = raw_base[:-4]
-        # browser-like headers to avoid mirror warnings and redirects
-        repo_referer = f"https://huggingface.co/{repo_id}"
-        probe_headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/markdown, text/plain, */*',
-            'Referer': repo_referer,
-            'Origin': 'https://huggingface.co',
-            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'same-origin'
-        }
-
-        for fname in common:
-            url = f"{raw_base}/{repo_id}/resolve/main/{fname}"
-            try:
-                # try HEAD without following redirects to detect Location
-                try:
-                    h = requests.head(url, timeout=8, allow_redirects=False, headers=probe_headers)
-                except Exception:
-                    h = None
-                loc = h.headers.get('Location') if h is not None else None
-                if loc:
-                    try:
-                        # follow redirect with updated Referer
-                        rh = probe_headers.copy()
-                        rh['Referer'] = loc
-                        r2 = requests.get(loc, timeout=12, allow_redirects=True, headers=rh)
-                        if r2.status_code == 200:
-                            ctype = r2.headers.get('Content-Type','')
-                            # skip obvious HTML warning pages
-                            body = r2.text or ''
-                            if 'text/html' in ctype and ('警告' in body or 'Warning' in body):
-                                continue
-                            size = int(r2.headers.get('Content-Length') or 0) or None
-                            found.append({"name": fname, "size": size, "type": None})
-                            continue
-                    except Exception:
-                        pass
-
-                # fallback: try GET directly with probe headers
-                try:
-                    g = requests.get(url, stream=True, timeout=12, headers=probe_headers)
-                    if g.status_code == 200:
-                        ctype = g.headers.get('Content-Type','')
-                        body = None
-                        try:
-                            body = g.text
-                        except Exception:
-                            body = None
-                        if 'text/html' in (g.headers.get('Content-Type','')) and body and ('警告' in body or 'Warning' in body):
-                            # mirror returned a warning page, skip
-                            continue
-                        size = int(g.headers.get('Content-Length') or 0) or None
-                        found.append({"name": fname, "size": size, "type": None})
-                except Exception:
-                    pass
-            except Exception:
-                pass
-        return found
+        # fallback: probe a list of common filenames via HEAD/GET
+        return list_common_files(repo_id, api_base=api_base)
     except Exception:
         return []
 
 
+COMMON_REPO_FILES = [
+    'README.md', 'README', 'config.json', 'model_index.json', 'pytorch_model.bin',
+    'tf_model.h5', 'flax_model.msgpack', 'adapter_config.json'
+]
+
+
+# only this much of an HTML response is read when checking for a mirror warning page
+_WARNING_PAGE_PEEK = 64 * 1024
+
+
+def _is_warning_page(resp: requests.Response) -> bool:
+    """True if resp (streamed) is a mirror's HTML warning page; reads at most _WARNING_PAGE_PEEK bytes."""
+    if 'text/html' not in resp.headers.get('Content-Type', ''):
+        return False
+    body = resp.raw.read(_WARNING_PAGE_PEEK, decode_content=True).decode('utf-8', 'replace')
+    return '警告' in body or 'Warning' in body
+
+
+def _probe_common_file(raw_base: str, repo_id: str, fname: str, probe_headers: Dict) -> Optional[Dict]:
+    """Probe a single raw file URL; return a file dict if it exists, else None.
+
+    Existence and size come from a HEAD request (or a one-byte ranged GET when
+    HEAD is not allowed), so probing weight files never downloads them. A body
+    is only read for HTML responses, to recognise a mirror's warning page.
+    """
+    url = f"{raw_base}/{repo_id}/resolve/main/{fname}"
+    headers = probe_headers
+    try:
+        r = _SESSION.head(url, timeout=8, allow_redirects=False, headers=headers)
+        loc = r.headers.get('Location')
+        if loc:
+            # follow the redirect with the Referer some mirrors expect
+            url = urljoin(url, loc)
+            headers = dict(probe_headers, Referer=url)
+            r = _SESSION.head(url, timeout=12, allow_redirects=True, headers=headers)
+        if r.status_code in (405, 501):
+            r = _SESSION.get(url, timeout=12, stream=True, headers=dict(headers, Range='bytes=0-0'))
+        with r:
+            if r.status_code not in (200, 206):
+                return None
+            if 'text/html' in r.headers.get('Content-Type', ''):
+                if r.request.method == 'HEAD':
+                    with _SESSION.get(url, timeout=12, stream=True, headers=headers) as page:
+                        if _is_warning_page(page):
+                            return None
+                elif _is_warning_page(r):
+                    return None
+            size = None
+            total = r.headers.get('Content-Range', '').rpartition('/')[2]
+            if r.status_code == 206 and total.isdigit():
+                size = int(total)
+            elif r.status_code == 200:
+                size = int(r.headers.get('Content-Length') or 0) or None
+            return {"name": fname, "size": size, "type": None}
+    except Exception:
+        return None
+
+
+def list_common_files(repo_id: str, api_base: Optional[str] = None, names: Optional[List[str]] = None) -> List[Dict]:
+    """Probe well-known filenames (COMMON_REPO_FILES by default) in a repo concurrently.
+
+    Used when the files API is unavailable (e.g. on some mirrors). Returns the same
+    dict format as list_model_files, in the order of `names`.
+    """
+    names = names or COMMON_REPO_FILES
+    # determine download base for raw file access
+    raw_base = "https://huggingface.co"
+    if api_base and isinstance(api_base, str) and api_base.startswith('http'):
+        # if api_base is a mirror and ends with /api, remove the /api part to form raw base
+        raw_base = api_base.rstrip('/')
+        if raw_base.endswith('/api'):
+            raw_base = raw_base[:-4]
+    # browser-like headers to avoid mirror warnings and redirects
+    repo_referer = f"https://huggingface.co/{repo_id}"
+    probe_headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/markdown, text/plain, */*',
+        'Referer': repo_referer,
+        'Origin': 'https://huggingface.co',
+        'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'same-origin'
+    }
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+        results = pool.map(lambda fname: _probe_common_file(raw_base, repo_id, fname, probe_headers), names)
+        return [it for it in results if it]
+
+
+@cached(ttl=3600)
 def get_model_metadata(repo_id: str, api_base: Optional[str] = None) -> Dict:
     """Fetch model metadata / model card info from the API.
 
@@ -140,13 +296,52 @@ def get_model_metadata(repo_id: str, api_base: Optional[str] = None) -> Dict:
     """
     try:
         base = api_base.rstrip('/') if api_base else HF_API_BASE
-        r = requests.get(f"{base}/models/{repo_id}", timeout=15)
+        r = _SESSION.get(f"{base}/models/{repo_id}", timeout=15)
         r.raise_for_status()
-        return r.json() or {}
+        return _loads(r.content) or {}
     except Exception:
         return {}
 
 
+def get_model_bundle(repo_id: str, api_base: Optional[str] = None) -> Dict:
+    """Fetch metadata, file list and README for a repo with as few requests as possible.
+
+    A single {base}/models/{repo_id}?blobs=true call returns the metadata together
+    with the `siblings` file list (including sizes). The README is not part of the
+    API payload and is fetched with get_model_readme in parallel.
+    Returns {"metadata": dict, "files": [{"name", "size", "type"}], "readme": str}.
+    """
+    def _fetch_metadata() -> Dict:
+        try:
+            base = api_base.rstrip('/') if api_base else HF_API_BASE
+            r = _SESSION.get(f"{base}/models/{repo_id}", params={'blobs': 'true'}, timeout=15)
+            r.raise_for_status()
+            return _loads(r.content) or {}
+        except Exception:
+            return {}
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        readme_future = pool.submit(get_model_readme, repo_id, api_base=api_base)
+        metadata = _fetch_metadata()
+        readme = readme_future.result()
+
+    siblings = metadata.get('siblings') if isinstance(metadata, dict) else None
+    if siblings:
+        files = [
+            {"name": it.get('rfilename') or '', "size": it.get('size'), "type": None}
+            for it in siblings if isinstance(it, dict)
+        ]
+    else:
+        files = list_model_files(repo_id, api_base=api_base)
+
+    return {
+        "metadata": metadata,
+        "files": files,
+        "readme": readme,
+    }
+
+
+@cached(ttl=3600)
 def get_model_readme(repo_id: str, api_base: Optional[str] = None) -> str:
     """Attempt to fetch a model README as text.
 
@@ -177,7 +372,7 @@ def get_model_readme(repo_id: str, api_base: Optional[str] = None) -> str:
 
     # 1) try explicit readme endpoint
     try:
-        r = requests.get(f"{base}/models/{repo_id}/readme", timeout=12, headers=headers)
+        r = _SESSION.get(f"{base}/models/{repo_id}/readme", timeout=12, headers=headers)
         if r.status_code == 200 and r.text:
             return r.text
     except Exception:
@@ -211,7 +406,7 @@ def get_model_readme(repo_id: str, api_base: Optional[str] = None) -> str:
         try:
             # HEAD first to detect redirect Location
             try:
-                h = requests.head(url, timeout=8, allow_redirects=False, headers=headers)
+                h = _SESSION.head(url, timeout=8, allow_redirects=False, headers=headers)
             except Exception:
                 h = None
             loc = h.headers.get('Location') if h is not None else None
@@ -221,7 +416,7 @@ def get_model_readme(repo_id: str, api_base: Optional[str] = None) -> str:
                 updated_headers['Referer'] = loc
                 try:
                     # follow the redirect with updated headers
-                    r2 = requests.get(loc, timeout=12, allow_redirects=True, headers=updated_headers)
+                    r2 = _SESSION.get(loc, timeout=12, allow_redirects=True, headers=updated_headers)
                     if r2.status_code == 200 and r2.text:
                         ctype = r2.headers.get('Content-Type','')
                         body = r2.text or ''
@@ -243,7 +438,7 @@ def get_model_readme(repo_id: str, api_base: Optional[str] = None) -> str:
 
             # fallback: direct GET with original headers
             try:
-                r = requests.get(url, timeout=12, allow_redirects=True, headers=headers)
+                r = _SESSION.get(url, timeout=12, allow_redirects=True, headers=headers)
                 if r.status_code == 200 and r.text:
                     ctype = r.headers.get('Content-Type','')
                     body = r.text or ''
@@ -287,7 +482,7 @@ def get_model_readme(repo_id: str, api_base: Optional[str] = None) -> str:
         ]
         for url in raw_paths:
             try:
-                r = requests.get(url, timeout=12, allow_redirects=True, headers=headers)
+                r = _SESSION.get(url, timeout=12, allow_redirects=True, headers=headers)
                 if r.status_code == 200 and r.text:
                     ctype = r.headers.get('Content-Type','')
                     body = r.text or ''
@@ -318,27 +513,131 @@ def get_model_readme(repo_id: str, api_base: Optional[str] = None) -> str:
     return ''
 
 
+HF_MIRRORS = ["https://huggingface.co", "https://hf-mirror.com"]
+_MIRROR_CACHE_FILE = Path.home() / ".cache" / "vdstudio" / "mirror.json"
+_MIRROR_CACHE_TTL = 24 * 3600
+_fastest_mirror: Optional[str] = None
+
+
+def _probe_mirror(base: str) -> Optional[float]:
+    """Return the HEAD round-trip time for base's API in seconds, or None if unreachable.
+
+    Probes use _PROBE_SESSION (no retries), so a dead or silent endpoint costs at
+    most one timeout and flaky mirrors are not timed including retry back-off.
+    """
+    try:
+        start = time.monotonic()
+        r = _PROBE_SESSION.head(f"{base}/api/models", params={'limit': 1}, timeout=1.5, allow_redirects=True)
+        if r.status_code >= 500:
+            return None
+        return time.monotonic() - start
+    except Exception:
+        return None
+
+
+def _pick_fastest_mirror() -> str:
+    """Pick the lowest-latency endpoint from HF_MIRRORS for mirror_choice='auto'.
+
+    The winner is kept in memory and in ~/.cache/vdstudio/mirror.json for 24h, so
+    later runs skip the probe. Nothing is exported: callers pass the endpoint on
+    (e.g. hf_hub_download(endpoint=...)) or set HF_ENDPOINT themselves.
+    """
+    global _fastest_mirror
+    if _fastest_mirror:
+        return _fastest_mirror
+
+    winner = None
+    try:
+        with _MIRROR_CACHE_FILE.open('r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('endpoint') in HF_MIRRORS and time.time() - float(cached.get('checked_at', 0)) < _MIRROR_CACHE_TTL:
+            winner = cached['endpoint']
+    except Exception:
+        pass
+
+    if winner is None:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            timings = list(zip(HF_MIRRORS, pool.map(_probe_mirror, HF_MIRRORS)))
+        reachable = [(t, base) for base, t in timings if t is not None]
+        if reachable:
+            winner = min(reachable)[1]
+            try:
+                _MIRROR_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                with _MIRROR_CACHE_FILE.open('w', encoding='utf-8') as f:
+                    json.dump({'endpoint': winner, 'checked_at': time.time()}, f)
+            except Exception:
+                pass
+        else:
+            # nothing reachable right now: use the official endpoint without caching it
+            return HF_MIRRORS[0]
+
+    _fastest_mirror = winner
+    return winner
+
+
 def _construct_download_url(repo_id: str, filename: str, mirror_choice: str = "auto") -> str:
     # mirror_choice may be 'auto' or a full base url like 'https://hf-mirror.com/'
     base = "https://huggingface.co"
     if mirror_choice and isinstance(mirror_choice, str) and mirror_choice.startswith("http"):
         base = mirror_choice.rstrip('/')
+    elif mirror_choice == "auto":
+        base = _pick_fastest_mirror()
     # standard resolve URL
     return f"{base}/{repo_id}/resolve/main/{filename}"
 
 
+def _fast_download(repo_id: str, filename: str, dest_dir: Path, mirror_choice: str = "auto") -> Optional[Path]:
+    """Download via huggingface_hub (multi-connection hf_transfer when HF_HUB_ENABLE_HF_TRANSFER=1).
+
+    Opt-in with VD_FAST_DOWNLOAD=1. Returns None when huggingface_hub is unavailable
+    or the download fails, so callers can fall back to the plain requests path.
+    Progress callbacks and stop_event are not supported on this path.
+    """
+    if os.environ.get('VD_FAST_DOWNLOAD') != '1':
+        return None
+    try:
+        from huggingface_hub import hf_hub_download
+    except Exception:
+        return None
+    try:
+        endpoint = None
+        if mirror_choice and isinstance(mirror_choice, str) and mirror_choice.startswith("http"):
+            endpoint = mirror_choice.rstrip('/')
+        elif mirror_choice == "auto":
+            endpoint = _pick_fastest_mirror()
+        p = hf_hub_download(repo_id=repo_id, filename=filename, local_dir=str(dest_dir), endpoint=endpoint)
+        return Path(p)
+    except Exception:
+        return None
+
+
+# page-cache hint for large downloads (Linux/BSD only); issued every _FADVISE_EVERY 1 MiB chunks
+_FADVISE_DONTNEED = getattr(os, 'POSIX_FADV_DONTNEED', None) if hasattr(os, 'posix_fadvise') else None
+_FADVISE_EVERY = 64
+
+
 def download_from_hf(repo_id: str, filename: str, dest_dir: Path, mirror_choice: str = "auto", callback=None, stop_event=None) -> Optional[Path]:
     try:
-        url = _construct_download_url(repo_id, filename, mirror_choice)
         dest_dir = Path(dest_dir)
         dest_dir.mkdir(parents=True, exist_ok=True)
+        fast_path = _fast_download(repo_id, filename, dest_dir, mirror_choice)
+        if fast_path is not None:
+            if callback:
+                try:
+                    callback('completed', 100)
+                except:
+                    pass
+            return fast_path
+        url = _construct_download_url(repo_id, filename, mirror_choice)
         dest_path = dest_dir / filename
-        with requests.get(url, stream=True, timeout=30) as r:
+        with _SESSION.get(url, stream=True, timeout=30) as r:
             r.raise_for_status()
             total = int(r.headers.get('Content-Length', 0) or 0)
-            with dest_path.open('wb') as f:
+            # chunks are already 1 MiB, so skip Python's write buffer
+            with dest_path.open('wb', buffering=0) as f:
                 downloaded = 0
-                for chunk in r.iter_content(chunk_size=8192):
+                n_chunks = 0
+                for chunk in r.iter_content(chunk_size=1 << 20):
                     try:
                         if stop_event and stop_event.is_set():
                             if callback:
@@ -350,8 +649,18 @@ def download_from_hf(repo_id: str, filename: str, dest_dir: Path, mirror_choice:
                     except:
                         pass
                     if chunk:
-                        f.write(chunk)
+                        # unbuffered writes may be short; loop until the chunk is on disk
+                        view = memoryview(chunk)
+                        while view:
+                            view = view[f.write(view):]
                         downloaded += len(chunk)
+                        n_chunks += 1
+                        if _FADVISE_DONTNEED is not None and n_chunks % _FADVISE_EVERY == 0:
+                            # the written weights won't be re-read here; let the kernel drop them from the page cache
+                            try:
+                                os.posix_fadvise(f.fileno(), 0, 0, _FADVISE_DONTNEED)
+                            except OSError:
+                                pass
                         if total and callback:
                             try:
                                 pct = int(downloaded * 100 // total)
@@ -401,7 +710,7 @@ def download_file_to_temp(repo_id: str, filename: str, dest_base: Path, mirror_c
         # attempt a GET with small timeout to inspect headers/body
         url = _construct_download_url(repo_id, filename, mirror_choice)
         headers = {'User-Agent': 'Mozilla/5.0', 'Accept': 'application/octet-stream'}
-        r = requests.get(url, timeout=15, allow_redirects=True, headers=headers, stream=True)
+        r = _SESSION.get(url, timeout=15, allow_redirects=True, headers=headers, stream=True)
         if r.status_code != 200:
             return None
         # If content-type is text and small, check for LFS pointer
@@ -508,3 +817,76 @@ def download_repo(repo_id: str, dest_dir: Path, api_base: Optional[str] = None,
             except:
                 pass
         return None
+
+
+# (keyword in repo id, family, tags); the first matching keyword wins
+_FAMILY_RULES = (
+    ('yolo', 'yolo', ('vision', 'detection')),
+    ('bert', 'bert', ('nlp', 'transformer')),
+    ('diffusion', 'diffusion', ('vision', 'generation')),
+    ('whisper', 'whisper', ('audio', 'speech')),
+)
+
+
+def _generate_model_config(repo_id: str, filename: str, size_bytes: Optional[int] = None,
+                           sha256: Optional[str] = None, local_path: Optional[Path] = None) -> Dict:
+    """Build a models.json entry for a file from a HF repo.
+
+    Pure function: it never touches the filesystem, so callers pass the size
+    (and optionally checksum/local path) they already know.
+    """
+    stem = Path(filename).stem
+    repo_lower = repo_id.lower()
+    family, tags = next(((f, t) for kw, f, t in _FAMILY_RULES if kw in repo_lower), ('custom', ()))
+    return {
+        'id': f"hf_{repo_id.replace('/', '_')}_{stem}",
+        'family': family,
+        'display_name': f"{repo_id.rsplit('/', 1)[-1]} ({stem})",
+        'source': 'huggingface',
+        'source_repo': repo_id,
+        'model_type': _detect_model_type(filename),
+        'tags': list(tags),
+        'versions': [{
+            'version': 'main',
+            'filename': filename,
+            'size': size_bytes,
+            'checksums': {'sha256': sha256 or ''},
+            'local_path': str(local_path) if local_path is not None else None,
+            'urls': {'huggingface': f"https://huggingface.co/{repo_id}/resolve/main/{filename}"},
+        }],
+    }
+
+
+def _generate_model_config_from_path(repo_id: str, filename: str, local_path: Path) -> Dict:
+    """_generate_model_config for a downloaded file, taking the size from local_path."""
+    try:
+        size = Path(local_path).stat().st_size
+    except OSError:
+        size = None
+    return _generate_model_config(repo_id, filename, size, local_path=local_path)
+
+
+def auto_configure_model(repo_id: str, filename: str, local_path: Path, models_db_path: Optional[Path] = None) -> Tuple[bool, Optional[Dict]]:
+    """Add (or replace) the entry for a downloaded file in models.json.
+
+    models_db_path defaults to resources/models.json. Returns (success, config)
+    where config is the entry that was written, or None on failure.
+    """
+    try:
+        db_path = Path(models_db_path) if models_db_path else Path('resources') / 'models.json'
+        config = _generate_model_config_from_path(repo_id, filename, local_path)
+        db = {'models': []}
+        if db_path.exists():
+            with db_path.open('rb') as f:
+                db = _loads(f.read()) or db
+        models = [m for m in db.setdefault('models', []) if m.get('id') != config['id']]
+        models.append(config)
+        db['models'] = models
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a sibling temp file and swap it in so readers never see a partial file
+        tmp_path = db_path.with_name(db_path.name + '.tmp')
+        tmp_path.write_bytes(_dumps_pretty(db))
+        os.replace(tmp_path, db_path)
+        return True, config
+    except Exception:
+        return False, None
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Small persistent response cache for the Hugging Face browser helpers.
+
+Responses are stored in a SQLite database (WAL mode) under ~/.cache/vdstudio,
+keyed by a hash of the function name and its arguments. Set VD_HF_CACHE=0 to
+bypass the cache entirely.
+"""
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+CACHE_DB = Path.home() / ".cache" / "vdstudio" / "hf_cache.sqlite3"
+
+_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+stats = {'hits': 0, 'misses': 0}
+
+
+def _enabled() -> bool:
+    return os.environ.get('VD_HF_CACHE', '1') != '0'
+
+
+def _get_conn() -> Optional[sqlite3.Connection]:
+    global _conn
+    if _conn is None:
+        try:
+            CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(CACHE_DB), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, fetched_at INTEGER, payload BLOB)"
+            )
+            conn.commit()
+            _conn = conn
+        except Exception:
+            return None
+    return _conn
+
+
+def _make_key(name: str, args: tuple, kwargs: dict) -> str:
+    raw = name + "|" + json.dumps([args, kwargs], sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode('utf-8')).hexdigest()
+
+
+def get(key: str, ttl: int):
+    """Return the cached object for key if younger than ttl seconds, else None."""
+    with _lock:
+        conn = _get_conn()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT fetched_at, payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        except Exception:
+            return None
+    if not row or time.time() - row[0] > ttl:
+        return None
+    try:
+        return json.loads(zlib.decompress(row[1]).decode('utf-8'))
+    except Exception:
+        return None
+
+
+def put(key: str, obj) -> None:
+    """Store obj (must be JSON serializable) under key."""
+    try:
+        payload = zlib.compress(json.dumps(obj, ensure_ascii=False).encode('utf-8'))
+    except Exception:
+        return
+    with _lock:
+        conn = _get_conn()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, fetched_at, payload) VALUES (?, ?, ?)",
+                (key, int(time.time()), payload),
+            )
+            conn.commit()
+        except Exception:
+            pass
+
+
+def cached(ttl: int = 3600):
+    """Decorator caching a helper's result on disk for ttl seconds.
+
+    Empty results ([], {}, '') are treated as failures and never stored.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled():
+                return func(*args, **kwargs)
+            key = _make_key(func.__qualname__, args, kwargs)
+            hit = get(key, ttl)
+            with _lock:
+                stats['hits' if hit is not None else 'misses'] += 1
+            if hit is not None:
+                return hit
+            result = func(*args, **kwargs)
+            if result:
+                put(key, result)
+            return result
+        return wrapper
+    return decorator
@@ -9,6 +9,7 @@ import os
 import shutil
 import hashlib
 import logging
+import functools
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
@@ -22,30 +23,60 @@ logger = logging.getLogger(__name__)
 
 MODELS_DB_PATH = Path("resources") / "models.json"
 DEFAULT_MODELS_DIR = Path("models")
+# find_local_models 识别的模型文件扩展名
+_MODEL_EXTS = (".pt", ".pth", ".onnx", ".tflite", ".bin", ".safetensors")
 
 # By default, built-in models DB is disabled to enforce selecting models from HF.
 # Set USE_LOCAL_MODELS_DB=1 in environment or pass an explicit path to enable.
 USE_LOCAL_MODELS_DB = bool(os.environ.get('USE_LOCAL_MODELS_DB'))
 
 
+@functools.lru_cache(maxsize=8)
+def _read_models_db(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """按 (路径, 修改时间) 缓存解析结果；文件被修改后 mtime 变化即自动失效"""
+    try:
+        with open(path_str, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            logger.info(f"成功加载模型数据库，包含 {len(data.get('models', []))} 个模型")
+            return data
+    except Exception as e:
+        logger.error(f"加载模型数据库失败: {e}")
+        return {"models": []}
+
+
+@functools.lru_cache(maxsize=8)
+def _models_index(path_str: str, mtime_ns: int) -> Dict[str, Dict[str, Any]]:
+    """模型 id -> 条目 的索引（首个同 id 条目优先，与线性查找一致）"""
+    index = {}
+    for m in _read_models_db(path_str, mtime_ns).get("models", []):
+        index.setdefault(m.get("id"), m)
+    return index
+
+
+def _db_cache_key(path: Optional[Path] = None) -> Optional[tuple]:
+    """返回可用于缓存的 (路径, mtime)；数据库被禁用或不存在时返回 None"""
+    if not USE_LOCAL_MODELS_DB:
+        return None
+    p = Path(path) if path else MODELS_DB_PATH
+    try:
+        return str(p), p.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_models_db(path: Optional[Path] = None) -> Dict[str, Any]:
+    """加载模型数据库。结果在进程内缓存，调用方不应修改返回的字典。"""
     p = Path(path) if path else MODELS_DB_PATH
     # if the built-in models DB is disabled, return empty structure
     if not USE_LOCAL_MODELS_DB:
         logger.info("本地内置模型数据库被禁用（USE_LOCAL_MODELS_DB 未设置），返回空模型列表")
         return {"models": []}
-    if not p.exists():
+    key = _db_cache_key(p)
+    if key is None:
         logger.warning(f"models.json 未找到: {p}")
         # 返回默认结构
         return {"models": []}
-    try:
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            logger.info(f"成功加载模型数据库，包含 {len(data.get('models', []))} 个模型")
-            return data
-    except Exception as e:
-        logger.error(f"加载模型数据库失败: {e}")
-        return {"models": []}
+    return _read_models_db(*key)
 
 
 def list_models(db: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
@@ -58,7 +89,13 @@ def list_models(db: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
 
 def get_model_entry(model_id: str, db: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
     if db is None:
-        db = load_models_db()
+        key = _db_cache_key()
+        m = _models_index(*key).get(model_id) if key else None
+        if m is not None:
+            logger.info(f"找到模型: {model_id}")
+            return m
+        logger.warning(f"未找到模型: {model_id}")
+        return None
     for m in db.get("models", []):
         if m.get("id") == model_id:
             logger.info(f"找到模型: {model_id}")
@@ -353,7 +390,9 @@ def find_local_models(models_dir: Optional[Path] = None) -> List[Path]:
         return []
     
     try:
-        models = [p for p in d.iterdir() if p.is_file() and p.suffix in (".pt", ".pth", ".onnx", ".tflite", ".bin", ".safetensors")]
+        # scandir 的 DirEntry 自带文件类型，无需对每个条目再 stat
+        with os.scandir(d) as it:
+            models = [Path(e.path) for e in it if e.name.endswith(_MODEL_EXTS) and e.is_file()]
         logger.info(f"找到 {len(models)} 个本地模型")
         return models
     except Exception as e:
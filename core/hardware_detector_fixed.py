@@ -2,6 +2,7 @@ import os
 import subprocess
 import platform
 import re
+import functools
 from pathlib import Path
 
 class HardwareDetector:
@@ -158,6 +159,12 @@ class HardwareDetector:
         """检测所有硬件信息"""
         return self.get_hardware_info()
 
+
+@functools.lru_cache(maxsize=1)
+def get_hardware_info():
+    """进程内缓存的硬件信息，所有调用方共享同一份检测结果（调用方不应修改返回的字典）"""
+    return HardwareDetector().detect_all()
+
 # 测试代码
 if __name__ == "__main__":
     detector = HardwareDetector()
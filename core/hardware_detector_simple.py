@@ -7,13 +7,22 @@ import os
 import sys
 import platform
 import subprocess
+import json
+import time
 import logging
-from typing import Dict, List, Any
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
 
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("HardwareDetectorSimple")
 
+# 硬件检测结果的磁盘缓存，TTL 内的后续启动直接复用
+HW_CACHE_FILE = Path.home() / ".cache" / "vdstudio" / "hw.json"
+HW_CACHE_TTL = 3600
+
 class HardwareDetector:
     """简化版硬件检测类，用于快速识别系统中的计算设备"""
     
@@ -89,14 +98,51 @@ class HardwareDetector:
             logger.warning(f"检测Intel GPU时出错: {e}")
         return False
     
-    def detect_all_hardware(self) -> Dict[str, Any]:
-        """快速检测所有硬件信息"""
+    def _load_cached(self) -> Optional[Dict[str, Any]]:
+        """读取未过期且属于当前系统的磁盘缓存"""
+        try:
+            with HW_CACHE_FILE.open('r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if time.time() - float(cached.get('checked_at', 0)) > HW_CACHE_TTL:
+                return None
+            info = cached.get('hardware_info')
+            if not isinstance(info, dict) or info.get('system') != self.system:
+                return None
+            return info
+        except Exception:
+            return None
+    
+    def _save_cached(self, hardware_info: Dict[str, Any]):
+        """写入磁盘缓存，失败时忽略"""
+        try:
+            HW_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with HW_CACHE_FILE.open('w', encoding='utf-8') as f:
+                json.dump({'checked_at': time.time(), 'hardware_info': hardware_info}, f)
+        except Exception as e:
+            logger.warning(f"写入硬件检测缓存失败: {e}")
+    
+    def detect_all_hardware(self, use_cache: bool = True) -> Dict[str, Any]:
+        """快速检测所有硬件信息
+
+        三种GPU检测互不依赖（均为外部命令调用），并发执行；
+        结果缓存到磁盘 HW_CACHE_TTL 秒，use_cache=False 时强制重新检测。
+        """
+        if use_cache:
+            cached = self._load_cached()
+            if cached is not None:
+                logger.info("使用缓存的硬件检测结果")
+                return cached
+        
         logger.info("开始快速硬件检测...")
         
-        # 检测GPU
-        nvidia_gpu = self.detect_nvidia_gpu()
-        amd_gpu = self.detect_amd_gpu()
-        intel_gpu = self.detect_intel_gpu()
+        # 并发检测GPU
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            nvidia_future = pool.submit(self.detect_nvidia_gpu)
+            amd_future = pool.submit(self.detect_amd_gpu)
+            intel_future = pool.submit(self.detect_intel_gpu)
+            nvidia_gpu = nvidia_future.result()
+            amd_gpu = amd_future.result()
+            intel_gpu = intel_future.result()
         
         # 检测CPU核心数
         try:
@@ -117,6 +163,7 @@ class HardwareDetector:
         }
         
         logger.info(f"硬件检测完成: {hardware_info}")
+        self._save_cached(hardware_info)
         return hardware_info
     
     def get_recommended_backend(self) -> str:
@@ -144,6 +191,12 @@ class HardwareDetector:
         else:
             return 'pytorch-cpu'
 
+
+@functools.lru_cache(maxsize=1)
+def get_hardware_info() -> Dict[str, Any]:
+    """进程内缓存的硬件信息，所有调用方共享同一份检测结果（调用方不应修改返回的字典）"""
+    return HardwareDetector().detect_all_hardware()
+
 # 测试代码
 if __name__ == "__main__":
     detector = HardwareDetector()
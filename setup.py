@@ -7,6 +7,7 @@ YOLO本地部署助手 - 环境设置脚本
 import os
 import sys
 import subprocess
+from collections import deque
 from pathlib import Path
 
 def download_file(url, destination):
@@ -14,12 +15,40 @@ def download_file(url, destination):
     try:
         import requests
         print(f"正在下载: {url}")
-        response = requests.get(url, stream=True)
+        # 禁止压缩传输，写入的字节数才能与 Content-Length 对照
+        response = requests.get(url, stream=True, headers={'Accept-Encoding': 'identity'})
         response.raise_for_status()
         
-        with open(destination, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # 直接写文件描述符（不经过 BufferedWriter 二次拷贝），已知大小时预分配空间
+        total_size = int(response.headers.get('content-length', 0))
+        fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        completed = False
+        try:
+            if total_size:
+                try:
+                    if hasattr(os, 'posix_fallocate'):
+                        os.posix_fallocate(fd, 0, total_size)
+                    else:
+                        os.ftruncate(fd, total_size)
+                except OSError:
+                    # 文件系统不支持预分配时跳过，照常顺序写入
+                    pass
+            written = 0
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                view = memoryview(chunk)
+                while view:
+                    n = os.write(fd, view)
+                    view = view[n:]
+                written += len(chunk)
+            if total_size and written != total_size:
+                raise IOError(f"文件不完整: {written}/{total_size} bytes")
+            completed = True
+        finally:
+            os.close(fd)
+            # 调用方只按文件名判断是否已下载：失败时删除（可能已预分配到完整大小的）半成品，
+            # 否则下次运行会跳过下载并去解压损坏的文件
+            if not completed:
+                os.unlink(destination)
         print(f"下载完成: {destination}")
         return True
     except Exception as e:
@@ -40,9 +69,13 @@ def setup_basic_environment():
     python_dir.mkdir(parents=True, exist_ok=True)
     downloads_dir.mkdir(parents=True, exist_ok=True)
     
+    # 一次性列出目录内容，后续用集合判断文件是否存在，避免逐个 stat
+    python_dir_names = {entry.name for entry in os.scandir(python_dir)}
+    downloads_dir_names = {entry.name for entry in os.scandir(downloads_dir)}
+    
     # 检查是否已安装Python
     python_exe = python_dir / "python.exe"
-    if python_exe.exists():
+    if python_exe.name in python_dir_names:
         print("✅ 已存在Python环境")
         return True
     
@@ -50,7 +83,7 @@ def setup_basic_environment():
     python_url = "https://mirrors.aliyun.com/python-release/windows/python-3.10.8-embed-amd64.zip"
     zip_path = downloads_dir / "python-3.10.8-embed-amd64.zip"
     
-    if not zip_path.exists():
+    if zip_path.name not in downloads_dir_names:
         print("📥 下载嵌入式Python 3.10.8...")
         if not download_file(python_url, zip_path):
             print("❌ Python下载失败")
@@ -60,6 +93,13 @@ def setup_basic_environment():
     print("📦 解压Python...")
     try:
         import zipfile
+        # 先一次性读入文件尾部（EOCD 与中央目录所在区域）预热页缓存，
+        # 避免 ZipFile 定位目录时的多次小块 seek/read
+        zip_size = zip_path.stat().st_size
+        tail_len = min(zip_size, 1 << 17)
+        with open(zip_path, 'rb') as f:
+            f.seek(zip_size - tail_len)
+            f.read(tail_len)
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
             zip_ref.extractall(python_dir)
         print("✅ Python解压完成")
@@ -74,7 +114,8 @@ def setup_basic_environment():
         get_pip_url = "https://bootstrap.pypa.io/get-pip.py"
         get_pip_path = python_dir / "get-pip.py"
         
-        if not get_pip_path.exists():
+        # 嵌入式压缩包不包含 get-pip.py，解压前的目录快照仍然有效
+        if get_pip_path.name not in python_dir_names:
             if not download_file(get_pip_url, get_pip_path):
                 print("❌ get-pip.py下载失败")
                 return False
@@ -84,11 +125,16 @@ def setup_basic_environment():
         print("✅ pip安装完成")
         
         # 配置python._pth文件以包含Scripts目录
+        # python310._pth 来自刚解压的压缩包，直接打开一次：已包含 import site 时不再重复追加
         pth_file = python_dir / "python310._pth"
-        if pth_file.exists():
-            with open(pth_file, 'a') as f:
-                f.write("\nimport site\n")
+        try:
+            with open(pth_file, 'r+') as f:
+                lines = [line.strip() for line in f.read().splitlines()]
+                if "import site" not in lines:
+                    f.write("\nimport site\n")
             print("✅ Python路径配置完成")
+        except FileNotFoundError:
+            pass
         
     except Exception as e:
         print(f"❌ pip安装失败: {e}")
@@ -96,8 +142,12 @@ def setup_basic_environment():
     
     return True
 
-def install_requirements():
-    """安装主应用程序依赖"""
+def install_requirements(verbose=False):
+    """安装主应用程序依赖
+
+    pip 输出按行流式读取，不在内存中整体缓冲；verbose 为 True 时实时回显，
+    否则仅保留最后若干行用于失败时提示。
+    """
     print("📦 安装应用程序依赖...")
     try:
         python_exe = Path("resources") / "python" / "3.10" / "python.exe"
@@ -106,16 +156,23 @@ def install_requirements():
             return False
         
         # 安装requirements.txt中的依赖
-        result = subprocess.run([
+        process = subprocess.Popen([
             str(python_exe), "-m", "pip", "install", 
             "-r", "requirements.txt"
-        ], capture_output=True, text=True)
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True)
+        
+        tail = deque(maxlen=20)
+        for line in process.stdout:
+            if verbose:
+                sys.stdout.write(line)
+            tail.append(line)
+        returncode = process.wait()
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ 依赖安装完成")
             return True
         else:
-            print(f"❌ 依赖安装失败: {result.stderr}")
+            print(f"❌ 依赖安装失败: {''.join(tail)}")
             return False
             
     except Exception as e:
@@ -134,8 +191,8 @@ def main():
         input("按回车键退出...")
         return
     
-    # 安装依赖
-    if not install_requirements():
+    # 安装依赖（--verbose 实时显示 pip 输出）
+    if not install_requirements(verbose="--verbose" in sys.argv[1:]):
         print("⚠️  依赖安装失败，部分功能可能受限")
     
     print()
@@ -8,7 +8,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from core.environment_manager_simple import EnvironmentManager
-from core.hardware_detector_fixed import HardwareDetector
+from core.hardware_detector_fixed import get_hardware_info
 
 def create_test_model():
     """创建测试模型文件"""
@@ -50,12 +50,14 @@ def test_hardware():
     """测试硬件检测功能"""
     print("\n🧪 测试硬件检测功能...")
     
-    detector = HardwareDetector()
-    hardware_info = detector.detect_all()
+    hardware_info = get_hardware_info()
+    cpu = hardware_info['cpu']
+    gpu = hardware_info['gpu']
+    mem = hardware_info['memory']
     
-    print(f"💻 CPU: {hardware_info['cpu']['name']}")
-    print(f"🎮 GPU: {hardware_info['gpu']['name']} ({hardware_info['gpu']['vendor']})")
-    print(f"🧠 内存: {hardware_info['memory']['total_gb']} GB")
+    print(f"💻 CPU: {cpu['name']}")
+    print(f"🎮 GPU: {gpu['name']} ({gpu['vendor']})")
+    print(f"🧠 内存: {mem['total_gb']} GB")
     
     if hardware_info['ai_acceleration']:
         print("✅ 支持AI加速")
@@ -7,6 +7,9 @@ import sys
 import os
 from pathlib import Path
 
+# 仅在 TEST_VERBOSE=1 时打印异常堆栈
+_VERBOSE = os.environ.get('TEST_VERBOSE', '0') == '1'
+
 def main():
     """主函数"""
     print("🎯 简单测试程序")
@@ -40,8 +43,11 @@ def main():
         
     except Exception as e:
         print(f"❌ 测试失败: {e}")
-        import traceback
-        traceback.print_exc()
+        if _VERBOSE:
+            import traceback
+            traceback.print_exc()
+        else:
+            print("  (设置 TEST_VERBOSE=1 查看完整堆栈)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""temp 目录下各脚本共用的启动辅助：将项目根目录加入 sys.path（仅插入一次）。
+
+用法（脚本位于 temp/ 下，运行时 temp/ 自动位于 sys.path 中）::
+
+    from _bootstrap import ROOT
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
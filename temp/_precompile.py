@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""预编译 app/ 与 core/ 的字节码，缩短各检查脚本首次导入 app.gui_ctk 等模块的时间。
+
+用法: python temp/_precompile.py
+在运行 import_check.py / test_import_gui_ctk.py / quick_functionality_check.py /
+test_gui.py 之前执行一次即可；之后这些脚本只需加载 __pycache__ 中的 .pyc。
+为无优化、-O、-OO 三种解释器模式都生成缓存，因此无论以何种方式运行脚本都能命中。
+"""
+
+import compileall
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+
+
+def precompile() -> bool:
+    ok = True
+    for name in ('app', 'core'):
+        ok = compileall.compile_dir(
+            str(project_root / name), quiet=1, optimize=[0, 1, 2], workers=0
+        ) and ok
+    return bool(ok)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if precompile() else 1)
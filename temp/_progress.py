@@ -0,0 +1,29 @@
+"""temp 目录下各脚本共用的进度回调：限制输出频率，避免下载时逐块打印。"""
+
+import sys
+import time
+
+
+class RateLimitedCB:
+    """可调用的进度回调 callback(message, progress)。
+
+    同一百分比下 interval 秒内只输出一次；百分比变化或出错（progress < 0）时立即输出。
+    """
+
+    __slots__ = ('_last_time', '_last_pct', '_interval')
+
+    def __init__(self, interval: float = 0.2):
+        self._last_time = 0.0
+        self._last_pct = -1
+        self._interval = interval
+
+    def __call__(self, message, progress):
+        if progress < 0:
+            sys.stdout.write(f"[ERR] {message}\n")
+            return
+        now = time.monotonic()
+        if progress == self._last_pct and now - self._last_time < self._interval:
+            return
+        self._last_time = now
+        self._last_pct = progress
+        sys.stdout.write(f"[{progress:3d}%] {message}\n")
@@ -10,15 +10,14 @@ import subprocess
 import platform
 import json
 
-# 尝试导入项目的 hardware_detector
+# 尝试导入项目的 hardware_detector（优先复用 core 中已完成检测的全局实例，避免重复探测）
 hardware_detector = None
 try:
-    from core import hardware_detector as core_hd
-    hardware_detector = core_hd
+    from core.hardware_detector import hardware_detector
 except Exception:
     try:
-        import app.hardware_detector as app_hd
-        hardware_detector = app_hd
+        from app.hardware_detector import HardwareDetector as AppHardwareDetector
+        hardware_detector = AppHardwareDetector()
     except Exception:
         hardware_detector = None
 
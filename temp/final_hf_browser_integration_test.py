@@ -7,11 +7,9 @@ HF浏览器最终集成测试
 import sys
 from pathlib import Path
 import tempfile
-import json
 
-# 添加项目路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
 def progress_callback(message, progress):
     """进度回调函数"""
@@ -109,20 +107,13 @@ def test_complete_hf_browser_workflow():
             
             models_db_path = Path(tmpdir) / "models.json"
             
-            success = auto_configure_model("test/repo", "test_model.pt", tmp_path, models_db_path)
-            if success and models_db_path.exists():
-                with open(models_db_path, 'r', encoding='utf-8') as f:
-                    db = json.load(f)
-                
-                if len(db.get("models", [])) > 0:
-                    model = db["models"][0]
-                    print(f"  ✓ 模型配置成功:")
-                    print(f"    ID: {model['id']}")
-                    print(f"    家族: {model['family']}")
-                    print(f"    来源: {model['source']}")
-                    print(f"    标签: {model.get('tags', [])}")
-                else:
-                    print(f"  ✗ 模型数据库为空")
+            success, model = auto_configure_model("test/repo", "test_model.pt", tmp_path, models_db_path)
+            if success and model:
+                print(f"  ✓ 模型配置成功:")
+                print(f"    ID: {model['id']}")
+                print(f"    家族: {model['family']}")
+                print(f"    来源: {model['source']}")
+                print(f"    标签: {model.get('tags', [])}")
             else:
                 print(f"  ✗ 模型自动配置失败")
         print()
@@ -8,16 +8,36 @@ VisionDeploy Studio - 最终集成测试脚本
 import sys
 import os
 import time
+import atexit
 import threading
 from pathlib import Path
 
-# 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
-# 确保当前目录也在路径中
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+# 进程内共享一个隐藏的 CTk 根窗口，避免每个 GUI 测试重复初始化 Tk 与主题
+_ROOT = None
+
+
+def _get_root():
+    """返回（必要时创建）共享的隐藏根窗口"""
+    global _ROOT
+    if _ROOT is None:
+        import customtkinter as ctk
+        _ROOT = ctk.CTk()
+        _ROOT.withdraw()
+        atexit.register(_destroy_root)
+    return _ROOT
+
+
+def _destroy_root():
+    global _ROOT
+    if _ROOT is not None:
+        try:
+            _ROOT.destroy()
+        except Exception:
+            pass
+        _ROOT = None
 
 def test_imports():
     """测试所有模块导入"""
@@ -58,9 +78,8 @@ def test_hardware_detection():
     print("\n2. 测试硬件检测...")
     
     try:
-        from core.hardware_detector_simple import HardwareDetector
-        detector = HardwareDetector()
-        hardware_info = detector.detect_all_hardware()
+        from core.hardware_detector_simple import get_hardware_info
+        hardware_info = get_hardware_info()
         print(f"  ✅ 硬件检测完成")
         print(f"     NVIDIA GPU: {'✅' if hardware_info.get('nvidia_gpu', False) else '❌'}")
         print(f"     AMD GPU: {'✅' if hardware_info.get('amd_gpu', False) else '❌'}")
@@ -129,8 +148,8 @@ def test_gui_initialization():
         from app.gui_ctk import MainApp
         import customtkinter as ctk
         
-        # 创建一个简单的GUI窗口测试
-        root = ctk.CTk()
+        # 复用共享根窗口，只创建并销毁测试控件
+        root = _get_root()
         root.title("测试窗口")
         root.geometry("300x200")
         
@@ -138,7 +157,7 @@ def test_gui_initialization():
         label.pack(pady=20)
         
         # 不实际显示窗口，只是测试创建
-        root.destroy()
+        label.destroy()
         print("  ✅ GUI初始化成功")
         return True
     except Exception as e:
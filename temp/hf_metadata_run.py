@@ -4,9 +4,8 @@
 Temp test: fetch model metadata and files for a sample repo using hf_browser new APIs.
 """
 import logging, sys, os
-proj = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-if proj not in sys.path:
-    sys.path.insert(0, proj)
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logging.getLogger('urllib3').setLevel(logging.DEBUG)
 
@@ -1,10 +1,8 @@
 import logging
 import sys
 from pathlib import Path
-# ensure project root is on sys.path
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 from app import hf_browser
 
 logging.basicConfig(level=logging.DEBUG)
@@ -6,10 +6,8 @@ Temp runner: call app.hf_browser.search_models with explicit hf mirror api_base
 import logging
 import sys
 import os
-# ensure project root is on path
-proj = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-if proj not in sys.path:
-    sys.path.insert(0, proj)
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 # enable debug logs for urllib3
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logging.getLogger('urllib3').setLevel(logging.DEBUG)
@@ -1,7 +1,10 @@
 # hf workflow test: search, readme, list files, download single file, import to models_imported
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
 from app import hf_browser
 from app import model_manager
@@ -15,6 +18,27 @@ def safe_print(*a, **k):
     print(*a, **k)
 
 
+def _fast_copy(src, dst):
+    """复制文件内容：优先 os.copy_file_range（支持时可走 reflink/内核内复制），否则 1MB 分块复制"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if n == 0:
+                    break
+                remaining -= n
+            if remaining == 0:
+                return
+        except (AttributeError, OSError):
+            pass
+        # 回退：从头重新复制
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+
 def run():
     query = 'Uno'
     safe_print('搜索模型:', query)
@@ -27,8 +51,15 @@ def run():
     repo_id = first.get('id') or first.get('modelId') or first.get('repoId') or ''
     safe_print('选择模型 repo:', repo_id)
 
-    safe_print('\n获取 README（尝试）')
-    readme = hf_browser.get_model_readme(repo_id)
+    # README 与文件列表互不依赖，并发请求以重叠两次网络往返
+    safe_print('\n获取 README 与文件列表（并发）')
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        readme_future = pool.submit(hf_browser.get_model_readme, repo_id)
+        files_future = pool.submit(hf_browser.list_model_files, repo_id)
+        readme = readme_future.result()
+        # 文件列表接口 404 时 list_model_files 已自行并发探测常见文件名，这里无需再次探测
+        files = files_future.result()
+
     if readme:
         out = Path('temp') / 'hf_readmes'
         out.mkdir(parents=True, exist_ok=True)
@@ -38,17 +69,8 @@ def run():
     else:
         safe_print('未能获取 README（可能被镜像或不存在）')
 
-    safe_print('\n列出仓库文件（尝试）')
-    files = hf_browser.list_model_files(repo_id)
     if not files:
-        safe_print('未获取到文件列表（list_model_files 返回空），尝试使用 download_repo 获取常见文件')
-        repo_folder = hf_browser.download_repo(repo_id, OUT_BASE, mirror_choice='auto', callback=lambda m,p: safe_print(m,p))
-        if repo_folder and repo_folder.exists():
-            safe_print('download_repo 完成，查看文件夹:', repo_folder)
-            for f in repo_folder.iterdir():
-                safe_print(' -', f.name)
-        else:
-            safe_print('download_repo 未能获取任何文件')
+        safe_print('未获取到文件列表（list_model_files 与常见文件探测均为空）')
         return
 
     # 如果拿到文件列表，找第一个非二进制常见文件（.md/.txt/.json）优先
@@ -70,7 +92,7 @@ def run():
             safe_print('文件下载成功:', p)
             IMPORT_BASE.mkdir(parents=True, exist_ok=True)
             dst = IMPORT_BASE / p.name
-            shutil.copy2(p, dst)
+            _fast_copy(p, dst)
             safe_print('已模拟导入到:', dst)
         else:
             safe_print('文件下载失败或受限')
@@ -1,6 +1,7 @@
 import importlib, sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 try:
     m = importlib.import_module('app.gui_ctk')
     print('imported app.gui_ctk OK')
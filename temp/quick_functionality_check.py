@@ -7,13 +7,8 @@ VisionDeploy Studio - 快速功能验证脚本
 import sys
 from pathlib import Path
 
-# 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-# 确保当前目录也在路径中
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
 def test_all_components():
     """测试所有核心组件"""
@@ -54,9 +49,8 @@ def test_all_components():
     # 3. 测试硬件检测器
     print("3. 测试硬件检测器...")
     try:
-        from core.hardware_detector_simple import HardwareDetector
-        detector = HardwareDetector()
-        hardware_info = detector.detect_all_hardware()
+        from core.hardware_detector_simple import get_hardware_info
+        hardware_info = get_hardware_info()
         print(f"   ✅ 硬件检测器正常工作")
         print(f"      NVIDIA GPU: {'✅' if hardware_info.get('nvidia_gpu', False) else '❌'}")
         print(f"      AMD GPU: {'✅' if hardware_info.get('amd_gpu', False) else '❌'}")
@@ -1,7 +1,12 @@
 # demo script: use app.hf_browser.download_repo to download common files from a HF repo
+import os
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
+
+# 若设置 VD_FAST_DOWNLOAD=1 且安装了 huggingface_hub/hf_transfer，则使用多连接下载；需在导入 hf_browser 前设置
+os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
 from app import hf_browser
 
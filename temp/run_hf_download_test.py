@@ -1,11 +1,13 @@
 from pathlib import Path
+import pickle
 import sys
 import os
 
-# ensure project root is on sys.path so `import app` works when running this script
-proj_root = Path(__file__).resolve().parents[1]
-if str(proj_root) not in sys.path:
-    sys.path.insert(0, str(proj_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
+
+# 若设置 VD_FAST_DOWNLOAD=1 且安装了 huggingface_hub/hf_transfer，则使用多连接下载；需在导入 hf_browser 前设置
+os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
 print('启动 HF 浏览器自动测试')
 try:
@@ -74,17 +76,44 @@ print('download_from_hf returned:', p)
 if p:
     print('文件大小:', p.stat().st_size)
 
-# 检查 torch
-try:
-    import torch
-    print('torch 可用，版本', torch.__version__)
-    if str(p).lower().endswith(('.pt', '.pth', '.bin')):
-        try:
-            obj = torch.load(str(p), map_location='cpu')
-            print('torch.load 成功，类型:', type(obj))
-        except Exception as e:
-            print('torch.load 失败:', e)
-except Exception:
-    print('系统中没有安装 torch，无法在本地加载模型')
+# 加载检查：.safetensors 通过 safe_open 内存映射、按需读取；.pt/.pth/.bin 先试 mmap + weights_only 的 torch.load，失败再逐级降级
+if p and str(p).lower().endswith('.safetensors'):
+    try:
+        from safetensors import safe_open
+        with safe_open(str(p), framework='pt', device='cpu') as f:
+            print('safe_open 成功，张量数:', len(list(f.keys())))
+    except Exception as e:
+        print('safetensors 加载失败:', e)
+else:
+    try:
+        import torch
+        print('torch 可用，版本', torch.__version__)
+        if p and str(p).lower().endswith(('.pt', '.pth', '.bin')):
+            # 逐级降级：
+            #   mmap + weights_only：zip 格式的纯权重文件
+            #   weights_only（不用 mmap）：旧版非 zip 格式的 checkpoint，mmap=True 时会报 RuntimeError
+            #   weights_only=False：完整模型 pickle（如 YOLO .pt），weights_only 时报 UnpicklingError；会执行 pickle 中的代码，仅用于可信来源
+            #   不带参数：PyTorch 过旧、不认识上述参数（TypeError）
+            load_modes = [
+                ('mmap + weights_only', {'weights_only': True, 'mmap': True}),
+                ('weights_only', {'weights_only': True, 'mmap': False}),
+                ('完整 pickle', {'weights_only': False}),
+                ('默认参数', {}),
+            ]
+            for mode, kwargs in load_modes:
+                try:
+                    obj = torch.load(str(p), map_location='cpu', **kwargs)
+                except (TypeError, pickle.UnpicklingError, RuntimeError) as e:
+                    print(f'torch.load（{mode}）失败，尝试下一种方式: {e}')
+                except Exception as e:
+                    print(f'torch.load（{mode}）失败:', e)
+                    break
+                else:
+                    print(f'torch.load 成功（{mode}），类型:', type(obj))
+                    break
+            else:
+                print('torch.load 失败：所有加载方式均不可用')
+    except Exception:
+        print('系统中没有安装 torch，无法在本地加载模型')
 
 print('测试结束')
@@ -4,13 +4,10 @@
 """
 
 import sys
-import threading
-import time
 from pathlib import Path
 
-# 添加项目路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
 def test_gui_functionality():
     """测试GUI基本功能"""
@@ -46,19 +43,20 @@ def test_gui_functionality():
         button = ctk.CTkButton(app, text="关闭测试", command=close_app)
         button.pack(pady=10)
         
-        # 模拟进度
-        def update_progress():
-            for i in range(101):
-                progressbar.set(i/100)
-                status_label.configure(text=f"测试进度: {i}%")
-                time.sleep(0.05)
-                if i == 50:
-                    status_label.configure(text="GUI功能正常")
+        # 模拟进度：在主线程中由 Tk 定时器驱动（Tk 控件非线程安全）
+        progress = 0
+
+        def tick():
+            nonlocal progress
+            progressbar.set(progress / 100)
+            status_label.configure(text=f"测试进度: {progress}%")
+            if progress == 50:
+                status_label.configure(text="GUI功能正常")
+            progress += 1
+            if progress <= 100:
+                app.after(50, tick)
         
-        # 在后台线程中运行进度更新
-        progress_thread = threading.Thread(target=update_progress)
-        progress_thread.daemon = True
-        progress_thread.start()
+        app.after(0, tick)
         
         print("✅ GUI窗口已创建")
         print("   窗口标题: VisionDeploy Studio - GUI测试")
@@ -4,18 +4,15 @@
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# 添加项目路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
+from _progress import RateLimitedCB
 
-def simple_callback(message, progress):
-    """简单的进度回调函数"""
-    if progress >= 0:
-        print(f"[{progress:3d}%] {message}")
-    else:
-        print(f"[ERR] {message}")
+# 限频的进度回调，避免下载时逐块打印
+simple_callback = RateLimitedCB()
 
 def test_hf_functions():
     """测试HF浏览器功能"""
@@ -33,37 +30,40 @@ def test_hf_functions():
             pipeline_tag = model.get('pipeline_tag', 'N/A')
             print(f"  {i}. {model_id} - {pipeline_tag}")
         
+        # 元数据、文件列表与README相互独立，并发获取后再按顺序打印
+        metadata, files, readme = {}, [], ''
+        test_model_id = results[0].get('modelId') if results else None
+        if test_model_id:
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                metadata_future = pool.submit(get_model_metadata, test_model_id)
+                files_future = pool.submit(list_model_files, test_model_id)
+                readme_future = pool.submit(get_model_readme, test_model_id)
+                metadata = metadata_future.result()
+                files = files_future.result()
+                readme = readme_future.result()
+        
         # 测试获取模型元数据
         print("\n2. 测试获取模型元数据:")
-        if results:
-            test_model_id = results[0].get('modelId')
-            if test_model_id:
-                metadata = get_model_metadata(test_model_id)
-                print(f"  Model ID: {metadata.get('modelId', 'N/A')}")
-                print(f"  Pipeline Tag: {metadata.get('pipeline_tag', 'N/A')}")
+        if test_model_id:
+            print(f"  Model ID: {metadata.get('modelId', 'N/A')}")
+            print(f"  Pipeline Tag: {metadata.get('pipeline_tag', 'N/A')}")
         
         # 测试列出模型文件
         print("\n3. 测试列出模型文件:")
-        if results:
-            test_model_id = results[0].get('modelId')
-            if test_model_id:
-                files = list_model_files(test_model_id)
-                print(f"  找到 {len(files)} 个文件")
-                for i, file_info in enumerate(files[:3], 1):
-                    name = file_info.get('name', 'N/A')
-                    size = file_info.get('size', 'N/A')
-                    print(f"    {i}. {name} ({size} bytes)")
+        if test_model_id:
+            print(f"  找到 {len(files)} 个文件")
+            for i, file_info in enumerate(files[:3], 1):
+                name = file_info.get('name', 'N/A')
+                size = file_info.get('size', 'N/A')
+                print(f"    {i}. {name} ({size} bytes)")
         
         # 测试获取模型README
         print("\n4. 测试获取模型README:")
-        if results:
-            test_model_id = results[0].get('modelId')
-            if test_model_id:
-                readme = get_model_readme(test_model_id)
-                if readme:
-                    print(f"  README长度: {len(readme)} 字符")
-                else:
-                    print("  无法获取README")
+        if test_model_id:
+            if readme:
+                print(f"  README长度: {len(readme)} 字符")
+            else:
+                print("  无法获取README")
         
         print("\n✅ HF浏览器功能测试完成")
         return True
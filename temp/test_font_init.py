@@ -3,12 +3,13 @@
 
 使用方式：在 VS Code 中打开此文件并运行 "Run Python File"（避免直接在终端中运行以遵循用户要求）。
 """
+import os
 import traceback
 from pathlib import Path
 import sys
 
-# 将项目根加入 sys.path，确保能导入 app 包
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
 try:
     from app import font_initializer
@@ -18,26 +19,31 @@ except Exception as e:
 
 def main():
     project_root = Path(__file__).resolve().parent.parent
-    out = []
-    out.append(f"project_root: {project_root}")
-    fonts_dir = project_root / "resources" / "fonts"
-    out.append(f"fonts_dir: {fonts_dir}")
-    out.append(f"fonts_dir.exists: {fonts_dir.exists()}")
-    if fonts_dir.exists():
-        out.append("fonts files:")
-        for p in sorted(fonts_dir.glob("*")):
-            out.append(f" - {p.name}")
-    try:
-        result = font_initializer.initialize_chinese_font(project_root)
-        out.append(f"initialize_chinese_font result: {result}")
-    except Exception:
-        out.append("initialize raised exception:")
-        out.append(traceback.format_exc())
-
     log_path = project_root / "temp" / "font_init_result.log"
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    log_path.write_text("\n".join(out), encoding="utf-8")
-    print("\n".join(out))
+    # 逐行写入日志并打印，不在内存中累积整份输出
+    with open(log_path, "w", encoding="utf-8", buffering=1 << 16) as fh:
+        def emit(line):
+            fh.write(line)
+            fh.write("\n")
+            print(line)
+
+        emit(f"project_root: {project_root}")
+        fonts_dir = project_root / "resources" / "fonts"
+        emit(f"fonts_dir: {fonts_dir}")
+        emit(f"fonts_dir.exists: {fonts_dir.exists()}")
+        if fonts_dir.exists():
+            emit("fonts files:")
+            with os.scandir(fonts_dir) as it:
+                names = sorted(entry.name for entry in it if entry.is_file())
+            for name in names:
+                emit(f" - {name}")
+        try:
+            result = font_initializer.initialize_chinese_font(project_root)
+            emit(f"initialize_chinese_font result: {result}")
+        except Exception:
+            emit("initialize raised exception:")
+            emit(traceback.format_exc())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,9 +6,8 @@
 import sys
 from pathlib import Path
 
-# 添加项目路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
 def test_gui_imports():
     """测试GUI相关模块是否能正常导入"""
@@ -9,9 +9,8 @@ from pathlib import Path
 import threading
 import time
 
-# 添加项目路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
 def test_gui_functionality():
     """测试GUI界面的各种功能和交互"""
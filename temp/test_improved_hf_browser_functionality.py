@@ -3,14 +3,16 @@
 测试改进后的HF浏览器功能
 """
 
+import io
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tempfile
 import shutil
 
-# 添加项目路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
 
 def progress_callback(message, progress):
     """进度回调函数"""
@@ -41,14 +43,16 @@ def test_model_type_detection():
     ]
     
     success_count = 0
+    lines = []
     for filename, expected_type in test_cases:
         detected_type = _detect_model_type(filename)
         if detected_type == expected_type:
-            print(f"  ✓ {filename} -> {detected_type}")
+            lines.append(f"  ✓ {filename} -> {detected_type}")
             success_count += 1
         else:
-            print(f"  ✗ {filename} -> {detected_type} (期望: {expected_type})")
+            lines.append(f"  ✗ {filename} -> {detected_type} (期望: {expected_type})")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     print(f"模型类型检测测试完成: {success_count}/{len(test_cases)} 通过")
     return success_count == len(test_cases)
 
@@ -71,14 +75,16 @@ def test_file_categorization():
     ]
     
     success_count = 0
+    lines = []
     for filename, expected_category in test_cases:
         category = _categorize_file(filename)
         if category == expected_category:
-            print(f"  ✓ {filename} -> {category}")
+            lines.append(f"  ✓ {filename} -> {category}")
             success_count += 1
         else:
-            print(f"  ✗ {filename} -> {category} (期望: {expected_category})")
+            lines.append(f"  ✗ {filename} -> {category} (期望: {expected_category})")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     print(f"文件分类测试完成: {success_count}/{len(test_cases)} 通过")
     return success_count == len(test_cases)
 
@@ -107,24 +113,26 @@ def test_model_file_detection():
     ]
     
     success_count = 0
+    lines = []
     total_tests = len(model_files) + len(non_model_files)
     
     # 测试模型文件
     for filename in model_files:
         if _is_model_file(filename):
-            print(f"  ✓ {filename} 正确识别为模型文件")
+            lines.append(f"  ✓ {filename} 正确识别为模型文件")
             success_count += 1
         else:
-            print(f"  ✗ {filename} 未识别为模型文件")
+            lines.append(f"  ✗ {filename} 未识别为模型文件")
     
     # 测试非模型文件
     for filename in non_model_files:
         if not _is_model_file(filename):
-            print(f"  ✓ {filename} 正确识别为非模型文件")
+            lines.append(f"  ✓ {filename} 正确识别为非模型文件")
             success_count += 1
         else:
-            print(f"  ✗ {filename} 错误识别为模型文件")
+            lines.append(f"  ✗ {filename} 错误识别为模型文件")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     print(f"模型文件检测测试完成: {success_count}/{total_tests} 通过")
     return success_count == total_tests
 
@@ -151,24 +159,26 @@ def test_config_file_detection():
     ]
     
     success_count = 0
+    lines = []
     total_tests = len(config_files) + len(non_config_files)
     
     # 测试配置文件
     for filename in config_files:
         if _is_config_file(filename):
-            print(f"  ✓ {filename} 正确识别为配置文件")
+            lines.append(f"  ✓ {filename} 正确识别为配置文件")
             success_count += 1
         else:
-            print(f"  ✗ {filename} 未识别为配置文件")
+            lines.append(f"  ✗ {filename} 未识别为配置文件")
     
     # 测试非配置文件
     for filename in non_config_files:
         if not _is_config_file(filename):
-            print(f"  ✓ {filename} 正确识别为非配置文件")
+            lines.append(f"  ✓ {filename} 正确识别为非配置文件")
             success_count += 1
         else:
-            print(f"  ✗ {filename} 错误识别为配置文件")
+            lines.append(f"  ✗ {filename} 错误识别为配置文件")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     print(f"配置文件检测测试完成: {success_count}/{total_tests} 通过")
     return success_count == total_tests
 
@@ -195,109 +205,134 @@ def test_documentation_file_detection():
     ]
     
     success_count = 0
+    lines = []
     total_tests = len(doc_files) + len(non_doc_files)
     
     # 测试文档文件
     for filename in doc_files:
         if _is_documentation_file(filename):
-            print(f"  ✓ {filename} 正确识别为文档文件")
+            lines.append(f"  ✓ {filename} 正确识别为文档文件")
             success_count += 1
         else:
-            print(f"  ✗ {filename} 未识别为文档文件")
+            lines.append(f"  ✗ {filename} 未识别为文档文件")
     
     # 测试非文档文件
     for filename in non_doc_files:
         if not _is_documentation_file(filename):
-            print(f"  ✓ {filename} 正确识别为非文档文件")
+            lines.append(f"  ✓ {filename} 正确识别为非文档文件")
             success_count += 1
         else:
-            print(f"  ✗ {filename} 错误识别为文档文件")
+            lines.append(f"  ✗ {filename} 错误识别为文档文件")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     print(f"文档文件检测测试完成: {success_count}/{total_tests} 通过")
     return success_count == total_tests
 
 def test_model_config_generation():
-    """测试模型配置生成功能"""
+    """测试模型配置生成功能（纯函数，直接传入文件大小，无需创建文件）"""
     print("测试模型配置生成功能...")
     
     from app.hf_browser import _generate_model_config
-    import tempfile
-    from pathlib import Path
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir) / "test_model.pt"
-        tmp_path.touch()
-        
-        # 测试YOLO模型
-        config = _generate_model_config("ultralytics/yolov8", "yolov8s.pt", tmp_path)
-        expected_id = "hf_ultralytics_yolov8_yolov8s"
-        if config["id"] == expected_id and config["family"] == "yolo":
-            print(f"  ✓ YOLO模型配置生成正确")
-            success1 = True
-        else:
-            print(f"  ✗ YOLO模型配置生成错误: id={config['id']}, family={config['family']}")
-            success1 = False
-        
-        # 测试BERT模型
-        config = _generate_model_config("bert-base-uncased", "pytorch_model.bin", tmp_path)
-        if config["family"] == "bert" and "nlp" in config["tags"]:
-            print(f"  ✓ BERT模型配置生成正确")
-            success2 = True
-        else:
-            print(f"  ✗ BERT模型配置生成错误: family={config['family']}, tags={config['tags']}")
-            success2 = False
-        
-        # 测试通用模型
-        config = _generate_model_config("unknown/model", "model.pt", tmp_path)
-        if config["family"] == "custom" and config["source"] == "huggingface":
-            print(f"  ✓ 通用模型配置生成正确")
-            success3 = True
-        else:
-            print(f"  ✗ 通用模型配置生成错误: family={config['family']}, source={config['source']}")
-            success3 = False
     
-    print(f"模型配置生成测试完成: {sum([success1, success2, success3])}/3 通过")
-    return success1 and success2 and success3
+    # 测试YOLO模型
+    config = _generate_model_config("ultralytics/yolov8", "yolov8s.pt", size_bytes=0)
+    expected_id = "hf_ultralytics_yolov8_yolov8s"
+    if config["id"] == expected_id and config["family"] == "yolo":
+        print(f"  ✓ YOLO模型配置生成正确")
+        success1 = True
+    else:
+        print(f"  ✗ YOLO模型配置生成错误: id={config['id']}, family={config['family']}")
+        success1 = False
+    
+    # 测试BERT模型
+    config = _generate_model_config("bert-base-uncased", "pytorch_model.bin", size_bytes=0)
+    if config["family"] == "bert" and "nlp" in config["tags"]:
+        print(f"  ✓ BERT模型配置生成正确")
+        success2 = True
+    else:
+        print(f"  ✗ BERT模型配置生成错误: family={config['family']}, tags={config['tags']}")
+        success2 = False
+    
+    # 测试通用模型
+    config = _generate_model_config("unknown/model", "model.pt", size_bytes=0)
+    if config["family"] == "custom" and config["source"] == "huggingface":
+        print(f"  ✓ 通用模型配置生成正确")
+        success3 = True
+    else:
+        print(f"  ✗ 通用模型配置生成错误: family={config['family']}, source={config['source']}")
+        success3 = False
+    
+    passed = success1 + success2 + success3
+    print(f"模型配置生成测试完成: {passed}/3 通过")
+    return passed == 3
+
+def check_auto_configure_model(tmp_dir):
+    """测试自动配置模型功能（tmp_dir 为共享临时目录下的子目录）
 
-def test_auto_configure_model():
-    """测试自动配置模型功能"""
+    需由本脚本的运行器传入目录，因此不以 test_ 开头，避免被 pytest 当作缺少夹具的用例收集。
+    """
     print("测试自动配置模型功能...")
     
     from app.hf_browser import auto_configure_model
-    import tempfile
-    import json
-    from pathlib import Path
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir) / "test_model.pt"
-        tmp_path.touch()
-        
-        models_db_path = Path(tmpdir) / "models.json"
-        
-        # 测试模型自动配置
-        success = auto_configure_model("test/repo", "test_model.pt", tmp_path, models_db_path)
-        
-        if success and models_db_path.exists():
-            # 验证配置文件内容
-            with open(models_db_path, 'r', encoding='utf-8') as f:
-                db = json.load(f)
-            
-            if len(db.get("models", [])) > 0:
-                model = db["models"][0]
-                if (model["id"] == "hf_test_repo_test_model" and 
-                    model["source"] == "huggingface" and
-                    model["source_repo"] == "test/repo"):
-                    print(f"  ✓ 模型自动配置成功")
-                    return True
-                else:
-                    print(f"  ✗ 模型配置内容不正确")
-                    return False
-            else:
-                print(f"  ✗ 模型数据库为空")
-                return False
+    
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = tmp_dir / "test_model.pt"
+    tmp_path.touch()
+    
+    models_db_path = tmp_dir / "models.json"
+    
+    # 测试模型自动配置；直接校验返回的配置，无需回读 models.json
+    success, model = auto_configure_model("test/repo", "test_model.pt", tmp_path, models_db_path)
+    
+    if success and model:
+        if (model["id"] == "hf_test_repo_test_model" and 
+            model["source"] == "huggingface" and
+            model["source_repo"] == "test/repo"):
+            print(f"  ✓ 模型自动配置成功")
+            return True
         else:
-            print(f"  ✗ 模型自动配置失败")
+            print(f"  ✗ 模型配置内容不正确")
             return False
+    else:
+        print(f"  ✗ 模型自动配置失败")
+        return False
+
+class _PerThreadStdout:
+    """按线程缓冲输出：并行执行的测试各写各的缓冲区，主线程照常输出到终端"""
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def capture(self):
+        self._local.buf = io.StringIO()
+        return self._local.buf
+
+    def release(self):
+        self._local.buf = None
+
+    def write(self, s):
+        buf = getattr(self._local, 'buf', None)
+        return (buf if buf is not None else self._real).write(s)
+
+    def flush(self):
+        self._real.flush()
+
+
+def _run_captured(proxy, test_func, args):
+    """在工作线程中运行单个测试，返回 (是否通过, 该测试的输出)"""
+    buf = proxy.capture()
+    try:
+        try:
+            ok = test_func(*args)
+        except Exception as e:
+            print(f"  测试 {test_func.__name__} 出错: {e}")
+            ok = False
+        print()
+        return ok, buf.getvalue()
+    finally:
+        proxy.release()
+
 
 def test_improved_hf_browser_functionality():
     """测试所有改进后的HF浏览器功能"""
@@ -311,18 +346,31 @@ def test_improved_hf_browser_functionality():
         test_config_file_detection,
         test_documentation_file_detection,
         test_model_config_generation,
-        test_auto_configure_model
+        check_auto_configure_model
     ]
     
+    # 需要临时目录的测试共用同一个 TemporaryDirectory，各自使用独立子目录
+    needs_tmp = {check_auto_configure_model}
+    
+    # 各测试相互独立，并行执行；输出按测试缓冲后再按原顺序写出，避免交错
     passed_tests = 0
-    for test_func in tests:
-        try:
-            if test_func():
-                passed_tests += 1
-            print()
-        except Exception as e:
-            print(f"  测试 {test_func.__name__} 出错: {e}")
-            print()
+    proxy = _PerThreadStdout(sys.stdout)
+    sys.stdout = proxy
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shared_tmp = Path(tmpdir)
+            with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+                futures = [
+                    ex.submit(_run_captured, proxy, test_func,
+                              (shared_tmp / test_func.__name__,) if test_func in needs_tmp else ())
+                    for test_func in tests
+                ]
+                for fut in futures:
+                    ok, output = fut.result()
+                    sys.stdout.write(output)
+                    passed_tests += bool(ok)
+    finally:
+        sys.stdout = proxy._real
     
     print("=" * 50)
     print(f"总计: {passed_tests}/{len(tests)} 个测试通过")
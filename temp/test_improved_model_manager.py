@@ -3,19 +3,19 @@
 测试改进后的模型管理器功能
 """
 
+import os
 import sys
 from pathlib import Path
 
-# 添加项目路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
+from _progress import RateLimitedCB
 
-def progress_callback(message, progress):
-    """进度回调函数"""
-    if progress >= 0:
-        print(f"[{progress:3d}%] {message}")
-    else:
-        print(f"[ERR] {message}")
+# 仅在 TEST_VERBOSE=1 时打印异常堆栈
+_VERBOSE = os.environ.get('TEST_VERBOSE', '0') == '1'
+
+# 限频的进度回调，避免下载时逐块打印
+progress_callback = RateLimitedCB()
 
 def test_improved_model_manager():
     """测试改进后的模型管理器功能"""
@@ -25,35 +25,33 @@ def test_improved_model_manager():
     try:
         from app.model_manager import list_models, get_model_entry, find_local_models
         
+        # 条目均为普通 dict：循环外取一次未绑定的 dict.get，避免每次访问都创建绑定方法
+        m_get = dict.get
+        
         # 1. 测试列出模型
         print("1. 测试列出模型:")
         models = list_models()
         print(f"找到 {len(models)} 个模型")
         for i, model in enumerate(models[:3], 1):
-            model_id = model.get('id', 'N/A')
-            display_name = model.get('display_name', 'N/A')
-            family = model.get('family', 'N/A')
-            print(f"  {i}. {display_name} ({model_id}) - {family}")
+            print(f"  {i}. {m_get(model, 'display_name', 'N/A')} ({m_get(model, 'id', 'N/A')}) - {m_get(model, 'family', 'N/A')}")
         print()
         
-        # 2. 测试获取模型条目
+        # 2. 测试获取模型条目：取第一个带 id 的模型，没有则跳过
         print("2. 测试获取模型条目:")
-        if models:
-            test_model_id = models[0].get('id')
-            if test_model_id:
-                entry = get_model_entry(test_model_id)
-                if entry:
-                    print(f"  Model ID: {entry.get('id', 'N/A')}")
-                    print(f"  Display Name: {entry.get('display_name', 'N/A')}")
-                    print(f"  Family: {entry.get('family', 'N/A')}")
-                    versions = entry.get('versions', [])
-                    print(f"  Versions: {len(versions)}")
-                    if versions:
-                        version = versions[0]
-                        print(f"    First Version: {version.get('version', 'N/A')}")
-                        print(f"    Filename: {version.get('filename', 'N/A')}")
-                else:
-                    print("  无法获取模型条目")
+        first_id = next((mid for mid in (m_get(m, 'id') for m in models) if mid), None)
+        entry = get_model_entry(first_id) if first_id else None
+        if entry:
+            print(f"  Model ID: {m_get(entry, 'id', 'N/A')}")
+            print(f"  Display Name: {m_get(entry, 'display_name', 'N/A')}")
+            print(f"  Family: {m_get(entry, 'family', 'N/A')}")
+            versions = m_get(entry, 'versions', [])
+            print(f"  Versions: {len(versions)}")
+            if versions:
+                version = versions[0]
+                print(f"    First Version: {m_get(version, 'version', 'N/A')}")
+                print(f"    Filename: {m_get(version, 'filename', 'N/A')}")
+        elif first_id:
+            print("  无法获取模型条目")
         print()
         
         # 3. 测试查找本地模型
@@ -69,8 +67,11 @@ def test_improved_model_manager():
         
     except Exception as e:
         print(f"❌ 测试失败: {e}")
-        import traceback
-        traceback.print_exc()
+        if _VERBOSE:
+            import traceback
+            traceback.print_exc()
+        else:
+            print("  (设置 TEST_VERBOSE=1 查看完整堆栈)")
         return False
 
 if __name__ == "__main__":
@@ -4,29 +4,33 @@
 测试模型下载功能的进度显示和错误处理
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
 
-# 添加项目路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 将项目根目录加入 sys.path（见 _bootstrap.py）
+from _bootstrap import ROOT
+from _progress import RateLimitedCB
 
-def progress_callback(message, progress):
-    """进度回调函数"""
-    if progress >= 0:
-        print(f"[{progress:3d}%] {message}")
-    else:
-        print(f"[ERR] {message}")
+# 仅在 TEST_VERBOSE=1 时打印异常堆栈
+_VERBOSE = os.environ.get('TEST_VERBOSE', '0') == '1'
+
+# 限频的进度回调，避免下载时逐块打印
+progress_callback = RateLimitedCB()
 
 def test_model_download_with_progress():
     """测试模型下载功能的进度显示和错误处理"""
     print("测试模型下载功能的进度显示和错误处理...")
     print()
     
+    # HF 搜索与第 1、2 步互不依赖：先在后台发起，与内置模型的列出/下载重叠执行
+    pool = ThreadPoolExecutor(max_workers=1)
     try:
         from app.model_manager import list_models, download_model
-        from app.hf_browser import download_from_hf
+        from app.hf_browser import download_from_hf, search_models, list_model_files
+        search_future = pool.submit(search_models, "yolo", limit=1)
         
         # 1. 测试列出模型
         print("1. 测试列出模型:")
@@ -67,14 +71,12 @@ def test_model_download_with_progress():
         # 3. 测试HF模型下载（如果HF浏览器可用）
         print("3. 测试HF模型下载:")
         try:
-            from app.hf_browser import search_models
-            results = search_models("yolo", limit=1)
+            results = search_future.result()
             if results:
                 test_model_id = results[0].get('modelId')
                 if test_model_id:
                     print(f"  找到HF模型: {test_model_id}")
                     # 获取文件列表
-                    from app.hf_browser import list_model_files
                     files = list_model_files(test_model_id)
                     if files:
                         # 下载第一个文件
@@ -110,9 +112,14 @@ def test_model_download_with_progress():
         
     except Exception as e:
         print(f"❌ 测试失败: {e}")
-        import traceback
-        traceback.print_exc()
+        if _VERBOSE:
+            import traceback
+            traceback.print_exc()
+        else:
+            print("  (设置 TEST_VERBOSE=1 查看完整堆栈)")
         return False
+    finally:
+        pool.shutdown(wait=False)
 
 if __name__ == "__main__":
     success = test_model_download_with_progress()
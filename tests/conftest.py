@@ -0,0 +1,16 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure the project root is on sys.path so `app` can be imported; done once
+# here instead of in every test module
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope='module')
+def shared_tmp(tmp_path_factory):
+    """One temp directory per test module; tests use their own subdirectories."""
+    return tmp_path_factory.mktemp('hf_cfg')
@@ -0,0 +1,184 @@
+import hashlib
+import http.server
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from tools.download_models import ModelDownloader, _part_meta_path, _save_part_meta
+from tools.download_models_cn import ChinaModelDownloader
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves in-memory files with ETag, Range/If-Range and If-None-Match support."""
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command == "GET":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        entry = self.server.files.get(self.path)
+        if entry is None:
+            return self._send(404)
+        body, etag = entry
+        headers = [("ETag", etag), ("Content-Type", "application/octet-stream")]
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, headers=headers)
+        rng = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if rng and if_range in (None, etag):
+            start = int(rng[len("bytes="):].split("-")[0])
+            if start >= len(body):
+                return self._send(416)
+            return self._send(206, body[start:], headers)
+        return self._send(200, body, headers)
+
+
+@pytest.fixture
+def file_server():
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.files = {}
+    srv.requests = []
+    threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _serve(srv, path, body):
+    """Publish body at path; returns its URL."""
+    srv.files[path] = (body, '"%s"' % hashlib.sha256(body).hexdigest()[:16])
+    return f"http://127.0.0.1:{srv.server_address[1]}{path}"
+
+
+@pytest.fixture
+def models_cwd(tmp_path, monkeypatch):
+    # ModelDownloader keeps models under ./resources/models
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "resources" / "models"
+
+
+def test_checksum_mismatch_discards_part_and_fails(file_server, models_cwd):
+    body = os.urandom(64 * 1024)
+    url = _serve(file_server, "/m.pt", body)
+
+    with ModelDownloader(mirrors={"m": [url]}, checksums={"m": "0" * 64}) as d:
+        assert not d.download_model("m")
+    assert not (models_cwd / "m.pt").exists()
+    assert not (models_cwd / "m.pt.part").exists()
+
+    with ModelDownloader(mirrors={"m": [url]}, checksums={"m": hashlib.sha256(body).hexdigest()}) as d:
+        assert d.download_model("m")
+    assert (models_cwd / "m.pt").read_bytes() == body
+
+
+def _range_requests(srv):
+    return [h for _, h in srv.requests if "Range" in h]
+
+
+def test_resume_sends_if_range_for_same_source(file_server, models_cwd):
+    body = os.urandom(256 * 1024)
+    url = _serve(file_server, "/r.pt", body)
+    models_cwd.mkdir(parents=True)
+    part = models_cwd / "r.pt.part"
+    part.write_bytes(body[:1000])
+    _save_part_meta(part, url, {"ETag": file_server.files["/r.pt"][1]})
+
+    with ModelDownloader(mirrors={"r": [url]}) as d:
+        assert d.download_model("r")
+    assert (models_cwd / "r.pt").read_bytes() == body
+    assert not _part_meta_path(part).exists()
+    (headers,) = _range_requests(file_server)
+    assert headers["Range"] == "bytes=1000-"
+    assert headers["If-Range"] == file_server.files["/r.pt"][1]
+
+
+@pytest.mark.parametrize("stale", ["other_mirror", "changed_upstream", "no_meta"])
+def test_stale_part_restarts_from_zero(file_server, models_cwd, stale):
+    old = os.urandom(1000)
+    body = os.urandom(256 * 1024)
+    url = _serve(file_server, "/r.pt", body)
+    models_cwd.mkdir(parents=True)
+    part = models_cwd / "r.pt.part"
+    part.write_bytes(old)
+    if stale == "other_mirror":
+        _save_part_meta(part, url.replace("/r.pt", "/mirror/r.pt"), {"ETag": file_server.files["/r.pt"][1]})
+    elif stale == "changed_upstream":
+        _save_part_meta(part, url, {"ETag": '"old-version"'})
+
+    with ModelDownloader(mirrors={"r": [url]}) as d:
+        assert d.download_model("r")
+    assert (models_cwd / "r.pt").read_bytes() == body
+
+
+def test_public_api_return_types(file_server, models_cwd):
+    body = os.urandom(1024)
+    url = _serve(file_server, "/a.pt", body)
+    missing = url.replace("/a.pt", "/missing.pt")
+
+    with ModelDownloader(mirrors={"a": [url], "b": [missing]}) as d:
+        assert d.model_urls == {"a": url, "b": missing}
+        assert d.download_model("a") is True
+        assert d.download_model("b") is False
+        assert d.download_all() is True
+    with ModelDownloader(mirrors={"b": [missing]}) as d:
+        assert d.download_all() is False
+
+    # the legacy path-returning API wraps a ModelDownloader instead of overriding it
+    assert not issubclass(ChinaModelDownloader, ModelDownloader)
+    (models_cwd / "a.pt").unlink()
+    with ChinaModelDownloader() as c:
+        c.mirrors = {"a": [missing, url]}
+        path = c.download_model("a")
+        assert Path(path).read_bytes() == body
+        assert c.download_all() == {"a": path}
+
+
+def test_refresh_without_etag_record_keeps_unchanged_file(file_server, models_cwd):
+    body = os.urandom(4096)
+    url = _serve(file_server, "/e.pt", body)
+    models_cwd.mkdir(parents=True)
+    (models_cwd / "e.pt").write_bytes(body)  # downloaded before .etags.json existed
+
+    with ModelDownloader(mirrors={"e": [url]}) as d:
+        assert d.download_model("e", refresh=True)
+        # the server ignores If-Modified-Since; size/mtime match, so the body is skipped
+        # and the ETag is recorded for the next refresh
+        assert len(file_server.requests) == 1
+        assert (models_cwd / "e.pt").read_bytes() == body
+
+        file_server.requests.clear()
+        assert d.download_model("e", refresh=True)
+        ((_, headers),) = file_server.requests
+        assert headers["If-None-Match"] == file_server.files["/e.pt"][1]
+
+
+def test_refresh_replaces_changed_file(file_server, models_cwd):
+    body = os.urandom(4096)
+    url = _serve(file_server, "/e.pt", body)
+    models_cwd.mkdir(parents=True)
+    (models_cwd / "e.pt").write_bytes(b"old")
+
+    with ModelDownloader(mirrors={"e": [url]}) as d:
+        assert d.download_model("e", refresh=True)
+    assert (models_cwd / "e.pt").read_bytes() == body
+    assert len(file_server.requests) == 1
+
+
+def test_race_mirrors_puts_first_reachable_mirror_first(file_server, models_cwd):
+    good = _serve(file_server, "/g.pt", b"x" * 10)
+    missing = good.replace("/g.pt", "/missing.pt")
+    with ModelDownloader() as d:
+        assert d._race_mirrors([missing, good]) == [good, missing]
+        # probes run on their own sessions, never on the download pool
+        assert d._session is None
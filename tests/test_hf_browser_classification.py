@@ -0,0 +1,92 @@
+import pytest
+
+from app.hf_browser import (
+    _categorize_file,
+    _detect_model_type,
+    _is_config_file,
+    _is_documentation_file,
+    _is_model_file,
+)
+
+
+@pytest.mark.parametrize('filename,expected', [
+    ("model.pt", "pytorch"),
+    ("pytorch_model.bin", "pytorch"),
+    ("model.safetensors", "safetensors"),
+    ("diffusion_pytorch_model.bin", "diffusion_pytorch"),
+    ("pytorch_lora_weights.safetensors", "lora"),
+    ("model.h5", "tensorflow"),
+    ("tf_model.pb", "tensorflow"),
+    ("model.tflite", "tflite"),
+    ("model.onnx", "onnx"),
+    ("flax_model.msgpack", "flax"),
+    ("ggml-model.bin", "ggml"),
+    ("unknown.txt", "unknown"),
+])
+def test_detect_model_type(filename, expected):
+    assert _detect_model_type(filename) == expected
+
+
+@pytest.mark.parametrize('filename,expected', [
+    ("pytorch_model.bin", "model"),
+    ("config.json", "config"),
+    ("README.md", "documentation"),
+    ("setup.py", "code"),
+    ("unknown.bin", "other"),
+    ("model.safetensors", "model"),
+    ("tokenizer_config.json", "config"),
+    ("license", "documentation"),
+    ("script.sh", "code"),
+])
+def test_categorize_file(filename, expected):
+    assert _categorize_file(filename) == expected
+
+
+@pytest.mark.parametrize('filename,expected', [
+    ("pytorch_model.bin", True),
+    ("model.safetensors", True),
+    ("tf_model.h5", True),
+    ("model.tflite", True),
+    ("model.onnx", True),
+    ("flax_model.msgpack", True),
+    ("ggml-model.bin", True),
+    ("README.md", False),
+    ("config.json", False),
+    ("setup.py", False),
+    ("license.txt", False),
+    ("unknown.txt", False),
+])
+def test_is_model_file(filename, expected):
+    assert _is_model_file(filename) is expected
+
+
+@pytest.mark.parametrize('filename,expected', [
+    ("config.json", True),
+    ("configuration.json", True),
+    ("model_config.json", True),
+    ("tokenizer_config.json", True),
+    ("adapter_config.json", True),
+    ("README.md", False),
+    ("pytorch_model.bin", False),
+    ("setup.py", False),
+    ("license.txt", False),
+    ("unknown.txt", False),
+])
+def test_is_config_file(filename, expected):
+    assert _is_config_file(filename) is expected
+
+
+@pytest.mark.parametrize('filename,expected', [
+    ("README.md", True),
+    ("readme.txt", True),
+    ("LICENSE", True),
+    ("changelog.md", True),
+    ("contributing.rst", True),
+    ("config.json", False),
+    ("pytorch_model.bin", False),
+    ("setup.py", False),
+    ("unknown.bin", False),
+    ("script.sh", False),
+])
+def test_is_documentation_file(filename, expected):
+    assert _is_documentation_file(filename) is expected
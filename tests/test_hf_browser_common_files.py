@@ -0,0 +1,72 @@
+import http.server
+import threading
+
+import pytest
+
+from app import hf_browser
+
+_BIG = 10 ** 9
+
+
+class _MirrorHandler(http.server.BaseHTTPRequestHandler):
+    """Fake mirror: a redirected multi-GB weight file, a HEAD-less config and a warning page."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, headers=(), body=b""):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if not any(name == "Content-Length" for name, _ in headers):
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command == "GET":
+            self.wfile.write(body)
+
+    def _route(self):
+        self.server.seen.append((self.command, self.path))
+        name = self.path.rsplit("/", 1)[-1]
+        if self.path == "/cdn/weights":
+            if self.command == "GET":
+                # a probe must never get here: the body would be the whole file
+                return self._reply(500)
+            return self._reply(200, [("Content-Type", "application/octet-stream"), ("Content-Length", str(_BIG))])
+        if name == "pytorch_model.bin":
+            return self._reply(302, [("Location", "/cdn/weights")])
+        if name == "README.md":
+            return self._reply(200, [("Content-Type", "text/markdown")], b"# hi\n")
+        if name == "config.json":
+            if self.command == "HEAD":
+                return self._reply(405)
+            assert self.headers.get("Range") == "bytes=0-0"
+            return self._reply(206, [("Content-Type", "application/json"), ("Content-Range", "bytes 0-0/42")], b"{")
+        if name == "tf_model.h5":
+            return self._reply(200, [("Content-Type", "text/html")], "<html>警告：该文件不可用</html>".encode())
+        return self._reply(404)
+
+    do_GET = do_HEAD = _route
+
+
+@pytest.fixture
+def mirror():
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _MirrorHandler)
+    srv.seen = []
+    threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_list_common_files_probes_headers_only(mirror):
+    base = f"http://127.0.0.1:{mirror.server_address[1]}"
+    files = hf_browser.list_common_files("org/repo", api_base=f"{base}/api")
+
+    assert files == [
+        {"name": "README.md", "size": 5, "type": None},
+        {"name": "config.json", "size": 42, "type": None},
+        {"name": "pytorch_model.bin", "size": _BIG, "type": None},
+    ]
+    assert ("GET", "/cdn/weights") not in mirror.seen
@@ -0,0 +1,38 @@
+import json
+
+from app.hf_browser import _generate_model_config, auto_configure_model
+
+
+def test_generate_model_config_families():
+    config = _generate_model_config("ultralytics/yolov8", "yolov8s.pt", size_bytes=0)
+    assert config["id"] == "hf_ultralytics_yolov8_yolov8s"
+    assert config["family"] == "yolo"
+
+    config = _generate_model_config("bert-base-uncased", "pytorch_model.bin", size_bytes=0)
+    assert config["family"] == "bert"
+    assert "nlp" in config["tags"]
+
+    config = _generate_model_config("unknown/model", "model.pt", size_bytes=0)
+    assert config["family"] == "custom"
+    assert config["source"] == "huggingface"
+
+
+def test_auto_configure_model_writes_and_replaces_entry(shared_tmp):
+    case_dir = shared_tmp / 'auto_configure'
+    case_dir.mkdir()
+    weights = case_dir / 'test_model.pt'
+    weights.write_bytes(b'')
+    db_path = case_dir / 'models.json'
+
+    ok, config = auto_configure_model("test/repo", "test_model.pt", weights, db_path)
+    assert ok
+    assert config["id"] == "hf_test_repo_test_model"
+    assert config["source"] == "huggingface"
+    assert config["source_repo"] == "test/repo"
+    assert config["versions"][0]["size"] == 0
+
+    # configuring the same file again replaces the entry instead of duplicating it
+    ok, _ = auto_configure_model("test/repo", "test_model.pt", weights, db_path)
+    assert ok
+    models = json.loads(db_path.read_text(encoding='utf-8'))["models"]
+    assert [m["id"] for m in models] == ["hf_test_repo_test_model"]
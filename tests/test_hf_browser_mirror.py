@@ -0,0 +1,45 @@
+import os
+import socket
+import time
+
+import requests
+
+from app import hf_browser
+
+
+class _FakeSession:
+    """Records HEAD probes; hf-mirror.com answers, huggingface.co is unreachable."""
+
+    def __init__(self):
+        self.probed = []
+
+    def head(self, url, **kwargs):
+        self.probed.append(url)
+        if url.startswith("https://huggingface.co"):
+            raise requests.ConnectionError("unreachable")
+        return type("Response", (), {"status_code": 200})()
+
+
+def test_pick_fastest_mirror_probes_without_exporting(tmp_path, monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(hf_browser, '_PROBE_SESSION', session)
+    monkeypatch.setattr(hf_browser, '_MIRROR_CACHE_FILE', tmp_path / 'mirror.json')
+    monkeypatch.setattr(hf_browser, '_fastest_mirror', None)
+    monkeypatch.delenv('HF_ENDPOINT', raising=False)
+
+    assert hf_browser._pick_fastest_mirror() == "https://hf-mirror.com"
+    assert len(session.probed) == len(hf_browser.HF_MIRRORS)
+    assert 'HF_ENDPOINT' not in os.environ
+    # the winner is cached in memory; no second probe
+    assert hf_browser._pick_fastest_mirror() == "https://hf-mirror.com"
+    assert len(session.probed) == len(hf_browser.HF_MIRRORS)
+
+
+def test_probe_of_silent_endpoint_gives_up_after_one_timeout():
+    # listening socket that never answers: connections are accepted by the kernel, no reply follows
+    with socket.socket() as srv:
+        srv.bind(("127.0.0.1", 0))
+        srv.listen(8)
+        start = time.monotonic()
+        assert hf_browser._probe_mirror(f"http://127.0.0.1:{srv.getsockname()[1]}") is None
+        assert time.monotonic() - start < 2.0
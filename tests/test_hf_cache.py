@@ -0,0 +1,23 @@
+from app import hf_cache
+
+
+def test_cached_reuses_stored_result_and_skips_empty(tmp_path, monkeypatch):
+    # Point the cache at a temporary database
+    monkeypatch.setattr(hf_cache, 'CACHE_DB', tmp_path / 'hf_cache.sqlite3')
+    monkeypatch.setattr(hf_cache, '_conn', None)
+
+    calls = []
+
+    @hf_cache.cached(ttl=60)
+    def fetch(repo_id, api_base=None):
+        calls.append(repo_id)
+        return {'id': repo_id} if repo_id else {}
+
+    assert fetch('a/b') == {'id': 'a/b'}
+    assert fetch('a/b') == {'id': 'a/b'}
+    assert calls == ['a/b']
+
+    # empty results are failures and must not be cached
+    assert fetch('') == {}
+    assert fetch('') == {}
+    assert calls == ['a/b', '', '']
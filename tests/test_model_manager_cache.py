@@ -0,0 +1,34 @@
+import json
+import os
+
+from app import model_manager
+
+
+def test_models_db_is_cached_until_file_changes(tmp_path, monkeypatch):
+    db_path = tmp_path / "models.json"
+    db_path.write_text(json.dumps({"models": [{"id": "a", "display_name": "A"}]}), encoding="utf-8")
+    monkeypatch.setattr(model_manager, 'MODELS_DB_PATH', db_path)
+    monkeypatch.setattr(model_manager, 'USE_LOCAL_MODELS_DB', True)
+
+    first = model_manager.list_models()
+    assert model_manager.list_models() is first
+    assert model_manager.get_model_entry("a")["display_name"] == "A"
+    assert model_manager.get_model_entry("missing") is None
+
+    # rewriting the file (new mtime) invalidates the cache
+    db_path.write_text(json.dumps({"models": [{"id": "b", "display_name": "B"}]}), encoding="utf-8")
+    st = db_path.stat()
+    os.utime(db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert [m["id"] for m in model_manager.list_models()] == ["b"]
+    assert model_manager.get_model_entry("a") is None
+
+
+def test_find_local_models_lists_weight_files_only(tmp_path):
+    (tmp_path / "a.pt").write_bytes(b"")
+    (tmp_path / "b.onnx").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "sub.pt").mkdir()
+    (tmp_path / "sub.pt" / "c.pt").write_bytes(b"")
+
+    found = sorted(p.name for p in model_manager.find_local_models(tmp_path))
+    assert found == ["a.pt", "b.onnx"]
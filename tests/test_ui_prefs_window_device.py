@@ -1,14 +1,7 @@
 import json
-import sys
-from pathlib import Path
 import tempfile
 import os
 
-# Ensure the project root is on sys.path so `app` can be imported
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
 from app import ui_prefs
 
 
@@ -4,9 +4,14 @@
 生成一个简单的测试模型文件，避免网络依赖
 """
 import os
-import struct
+from array import array
 from pathlib import Path
 
+# 模型头部标识
+_MAGIC = b"YOLO_TEST_MODEL_V1.0"
+# 测试数据：100 个本机字节序的 float32（与逐个 struct.pack('f', ...) 的结果相同），模块加载时序列化一次
+_TEST_DATA = array('f', [i * 0.1 for i in range(100)]).tobytes()
+
 def create_dummy_model(model_name):
     """创建虚拟模型文件"""
     models_dir = Path("resources/models")
@@ -22,14 +27,9 @@ def create_dummy_model(model_name):
     
     # 创建一个简单的模型文件头信息
     try:
-        with open(model_path, 'wb') as f:
-            # 写入模型标识
-            f.write(b"YOLO_TEST_MODEL_V1.0")
-            # 写入模型名称
-            f.write(model_name.encode('utf-8'))
-            # 写入一些测试数据
-            for i in range(100):
-                f.write(struct.pack('f', i * 0.1))
+        # 标识 + 模型名称 + 测试数据拼好后一次写入；已整体成块，无需缓冲层
+        with open(model_path, 'wb', buffering=0) as f:
+            f.write(_MAGIC + model_name.encode('utf-8') + _TEST_DATA)
         
         print(f"✅ 测试模型创建成功: {model_path}")
         return str(model_path)
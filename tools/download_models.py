@@ -4,102 +4,549 @@ YOLO模型下载工具
 用于下载常用的YOLO模型文件进行测试
 """
 
+import hashlib
+import json
 import os
-import requests
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
+from typing import Final
+
+# 可选：安装 tqdm 后用进度条显示下载进度（自带限频），否则退回限频的文本进度
+try:
+    from tqdm import tqdm
+except Exception:
+    tqdm = None
+
+# 每次从连接读取 1 MiB，减少 Python 层循环次数
+CHUNK_SIZE = 1 << 20
+
+# 模型文件的 SHA-256 {模型名: 十六进制摘要}，须取自上游发布页/模型卡，不可用本地下载的结果代填；
+# 目前尚无登记，未登记的模型只校验大小和内容类型。也可通过 ModelDownloader(checksums=...) 按实例传入
+EXPECTED_SHA256: Final = {}
+
+# 进度输出的最小间隔（秒）
+PROGRESS_INTERVAL = 0.25
+
+# 并行下载时多个线程共用终端，输出需加锁以免进度行互相穿插
+_print_lock = threading.Lock()
+
+# 正在显示的 tqdm 进度条占用的行号；并行下载时每个进度条固定在自己的一行
+_bar_positions = set()
+
+
+def _log(*args, **kwargs):
+    if tqdm is not None:
+        # 经由 tqdm.write 输出，日志行打印在进度条上方而不会把进度条冲乱
+        tqdm.write(" ".join(map(str, args)), end=kwargs.get("end", "\n"))
+        return
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+def _create_session():
+    """复用连接的 Session：同一主机的后续请求免去 TCP/TLS 握手，并对限流/网关错误自动退避重试"""
+    # requests 及其依赖导入较慢，只列出模型或直接退出时不需要，推迟到首次联网时导入
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    # 429 也在重试之列，urllib3 会遵循响应中的 Retry-After
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _preallocate(f, size):
+    """已知剩余大小时从当前写入位置起预先分配磁盘空间，让文件系统分配连续区段（不支持的平台忽略）"""
+    if size > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), f.tell(), size)
+        except OSError:
+            pass
+
+
+def _copy_stream(src, f, size):
+    """把响应流整体拷入文件：预分配空间后交给 shutil.copyfileobj 按 CHUNK_SIZE 读写"""
+    _preallocate(f, size)
+    try:
+        shutil.copyfileobj(src, f, CHUNK_SIZE)
+    finally:
+        # 预分配后若中途断开，截掉尚未写入的尾部，文件大小始终等于已写入字节数
+        f.truncate(f.tell())
+
+
+def _check_response(response):
+    """检查下载响应：HTTP 错误抛出 HTTPError，返回网页时抛出 ValueError；抛出前先关闭响应"""
+    # 发布页限流/出错时可能返回 HTML 页面，不能当作模型文件保存
+    is_html = response.headers.get("Content-Type", "").startswith("text/html")
+    if not response.ok or is_html:
+        response.close()
+    response.raise_for_status()
+    if is_html:
+        raise ValueError("服务器返回的是网页而不是模型文件")
+
+
+def _matches_local(headers, st):
+    """服务器不理会条件请求（返回 200）时的退路：大小与本地文件一致，且 Last-Modified 不晚于本地修改时间"""
+    length = headers.get("Content-Length")
+    if length is None or int(length) != st.st_size:
+        return False
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        try:
+            return parsedate_to_datetime(last_modified).timestamp() <= st.st_mtime
+        except (TypeError, ValueError):
+            pass
+    return True
+
+
+def _part_meta_path(part_path):
+    """.part 旁的记录文件：保存已下载部分的来源地址与 ETag/Last-Modified"""
+    return part_path.with_name(part_path.name + ".json")
+
+
+def _load_part_meta(part_path):
+    try:
+        with open(_part_meta_path(part_path), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_part_meta(part_path, url, headers):
+    meta = {"url": url, "etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+    _part_meta_path(part_path).write_text(json.dumps(meta), encoding="utf-8")
+
+
+def _discard_part(part_path):
+    part_path.unlink(missing_ok=True)
+    _part_meta_path(part_path).unlink(missing_ok=True)
+
+
+def _if_range_value(meta, url):
+    """续传用的 If-Range 值；.part 不是来自 url，或没有可用的校验器时返回 None
+
+    If-Range 只接受强 ETag 或 Last-Modified，弱 ETag（W/ 前缀）不能用来判断字节是否一致。
+    """
+    if not meta or meta.get("url") != url:
+        return None
+    etag = meta.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return meta.get("last_modified")
+
+
+def _get_resumable(session, url, part_path):
+    """按 .part 文件已有的大小发起续传请求，返回 (response, offset)
+
+    只有 .part 记录的来源就是 url 时才续传，并带上 If-Range：文件在服务器上已更新时返回完整内容（200），
+    offset 归零、从头写，不会把新内容接在旧前缀后面。来源不同或没有记录时直接从头下载；
+    Range 越界（416）时丢弃旧的 .part 重新下载。
+    """
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    # 续传按字节偏移计算，需禁止压缩传输
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        validator = _if_range_value(_load_part_meta(part_path), url)
+        if validator is None:
+            _discard_part(part_path)
+            offset = 0
+        else:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+    response = session.get(url, stream=True, timeout=(5, 60), headers=headers)
+    if offset and response.status_code == 416:
+        response.close()
+        _discard_part(part_path)
+        return _get_resumable(session, url, part_path)
+    _check_response(response)
+    if offset and response.status_code != 206:
+        offset = 0
+    if not offset:
+        _save_part_meta(part_path, url, response.headers)
+    return response, offset
+
+
+def _sha256_of(path):
+    """计算文件 SHA-256；Python 3.11+ 用 hashlib.file_digest（在 C 层循环读取并释放 GIL）"""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(block)
+        return h.hexdigest()
+
+
+def _verify_download(part_path, expected_size, expected_sha256=None):
+    """校验下载结果，不通过时抛出 ValueError
+
+    大小不足时保留 .part 以便续传；SHA-256 不匹配说明内容有误，删除后重新下载。
+    """
+    size = part_path.stat().st_size
+    if expected_size and size != expected_size:
+        raise ValueError(f"文件不完整: {size}/{expected_size} bytes")
+    if expected_sha256:
+        digest = _sha256_of(part_path)
+        if digest != expected_sha256.lower():
+            _discard_part(part_path)
+            raise ValueError(f"SHA-256 校验失败: {digest}")
+
+
+def _open_part(part_path, offset):
+    """打开 .part 文件并定位到 offset 处继续写
+
+    不用追加模式：预分配会把文件扩展到最终大小，追加写总落在文件末尾，会跳过预分配的区段。
+    """
+    f = open(part_path, 'r+b' if offset else 'wb')
+    f.seek(offset)
+    return f
+
+
+class _ProgressReader:
+    """包装响应流供 _copy_stream 读取，顺带累计字节数并限频输出进度（有 tqdm 时交给进度条）"""
+
+    def __init__(self, raw, label, total_size, start=0):
+        self._read = raw.read
+        self.label = label
+        self.total_size = total_size
+        self.downloaded = start
+        self._last_report = 0.0
+        self._bar = None
+        if tqdm is not None:
+            with _print_lock:
+                self._position = next(i for i in range(len(_bar_positions) + 1) if i not in _bar_positions)
+                _bar_positions.add(self._position)
+            # leave=False：完成后清掉该行，行号留给下一个下载
+            self._bar = tqdm(total=total_size or None, initial=start, desc=label, position=self._position,
+                             leave=False, unit="B", unit_scale=True, unit_divisor=1024)
+
+    def read(self, n=-1):
+        chunk = self._read(n)
+        self.downloaded += len(chunk)
+        if self._bar is not None:
+            self._bar.update(len(chunk))
+            return chunk
+        now = time.monotonic()
+        if self.total_size > 0 and now - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = now
+            percent = (self.downloaded / self.total_size) * 100
+            _log(f"  [{self.label}] 进度: {percent:.1f}% ({self.downloaded}/{self.total_size} bytes)", end='\r')
+        return chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._bar is not None:
+            self._bar.close()
+            with _print_lock:
+                _bar_positions.discard(self._position)
+
+
+# 常用YOLO模型的下载地址：每个模型一组 URL，官方源固定放在最后，前面是镜像
+DEFAULT_MIRRORS: Final = {
+    "yolov5s": [
+        "https://huggingface.co/ultralytics/yolov5/resolve/main/yolov5s.pt",
+        "https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5s.pt",
+    ],
+    "yolov5m": ["https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5m.pt"],
+    "yolov5l": ["https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5l.pt"],
+    "yolov8n": [
+        "https://huggingface.co/ultralytics/yolov8/resolve/main/yolov8n.pt",
+        "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8n.pt",
+    ],
+    "yolov8s": ["https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8s.pt"],
+}
+
 
 class ModelDownloader:
-    def __init__(self):
+    def __init__(self, mirrors=None, max_parallel=4, checksums=None):
+        # {模型名: [镜像 URL..., 官方 URL]}，默认使用 DEFAULT_MIRRORS
+        self.mirrors = dict(DEFAULT_MIRRORS if mirrors is None else mirrors)
+        # {模型名: SHA-256}，下载完成后据此校验，默认使用 EXPECTED_SHA256
+        self.checksums = dict(EXPECTED_SHA256 if checksums is None else checksums)
+        # 批量下载时同时进行的请求数上限，避免并发过多触发服务器限流
+        self.max_parallel = max_parallel
+        # 所有下载共用一个连接池（pool_maxsize 需不小于 max_parallel），首次联网时创建
+        self._session = None
+        self._session_lock = threading.Lock()
         self.models_dir = Path("resources/models")
         self.models_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 常用YOLO模型下载链接
-        self.model_urls = {
-            "yolov5s": "https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5s.pt",
-            "yolov5m": "https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5m.pt", 
-            "yolov5l": "https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5l.pt",
-            "yolov8n": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8n.pt",
-            "yolov8s": "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8s.pt"
-        }
-        
-        # 国内镜像（备用）
-        self.mirror_urls = {
-            "yolov5s": "https://huggingface.co/ultralytics/yolov5/resolve/main/yolov5s.pt",
-            "yolov8n": "https://huggingface.co/ultralytics/yolov8/resolve/main/yolov8n.pt"
-        }
-    
-    def download_model(self, model_name, use_mirror=False):
-        """下载指定的YOLO模型"""
-        if model_name not in self.model_urls:
-            print(f"❌ 不支持的模型: {model_name}")
-            print(f"✅ 支持的模型: {list(self.model_urls.keys())}")
+        # models_dir 的 {文件名: 大小} 快照，由 _scan 惰性生成，下载成功后失效
+        self._scan_cache = None
+        # 各模型下载时服务器给出的 ETag/Last-Modified，refresh 时据此发条件请求
+        self._etag_file = self.models_dir / ".etags.json"
+        self._etag_lock = threading.Lock()
+    
+    @property
+    def session(self):
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = _create_session()
+        return self._session
+    
+    def _scan(self):
+        """一次 os.scandir 取得 models_dir 下所有文件的大小，代替逐个模型 exists()/stat()"""
+        if self._scan_cache is None:
+            with os.scandir(self.models_dir) as it:
+                self._scan_cache = {e.name: e.stat().st_size for e in it if e.is_file()}
+        return self._scan_cache
+    
+    def _load_etags(self):
+        """读取 {模型名: {"url", "etag", "last_modified"}}；文件不存在或损坏时返回空表"""
+        try:
+            with open(self._etag_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_etags(self, etags):
+        """先写临时文件再替换，避免中断时留下半个 JSON"""
+        tmp_path = self._etag_file.with_name(self._etag_file.name + ".tmp")
+        tmp_path.write_text(json.dumps(etags, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self._etag_file)
+    
+    def _record_etag(self, model_name, url, headers):
+        """记录本次下载的校验器；校验器只对给出它的地址有效，因此连同 URL 一起保存"""
+        entry = {"url": url, "etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+        # download_all 的各线程共用同一个 .etags.json
+        with self._etag_lock:
+            etags = self._load_etags()
+            if entry["etag"] or entry["last_modified"]:
+                etags[model_name] = entry
+            else:
+                etags.pop(model_name, None)
+            self._save_etags(etags)
+    
+    def _revalidate(self, model_name, model_path):
+        """向服务器确认已下载的模型是否有更新，返回 (url, response, unchanged)；请求失败时返回 None
+
+        有 .etags.json 记录时带 If-None-Match/If-Modified-Since 请求原地址；没有记录（如此功能加入前下载的文件）时
+        以本地文件的修改时间发 If-Modified-Since 请求官方地址，服务器仍返回 200 时再比较大小与 Last-Modified，
+        判定未变化后补记校验器。unchanged 为 True 时响应已关闭，否则交给 _fetch 写入（由其负责关闭）。
+        """
+        entry = self._load_etags().get(model_name)
+        headers = {"Accept-Encoding": "identity"}
+        if entry:
+            url = entry["url"]
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        else:
+            url = self.mirrors[model_name][-1]
+            st = model_path.stat()
+            headers["If-Modified-Since"] = formatdate(st.st_mtime, usegmt=True)
+        import requests
+        try:
+            response = self.session.get(url, stream=True, timeout=(5, 60), headers=headers)
+        except requests.exceptions.RequestException as e:
+            _log(f"   [{model_name}] 检查更新失败: {e}")
+            return None
+        unchanged = response.status_code == 304
+        if not entry and response.status_code == 200:
+            unchanged = _matches_local(response.headers, st)
+        if unchanged:
+            response.close()
+            if not entry:
+                self._record_etag(model_name, url, response.headers)
+        return url, response, unchanged
+    
+    def _probe(self, url):
+        """只请求第一个字节，判断镜像是否可用
+
+        每次探测用独立的 Session：落选的探测可能在后台一直运行到超时，不能与下载线程共用 self.session。
+        """
+        import requests
+        try:
+            with requests.Session() as session, \
+                    session.get(url, headers={"Range": "bytes=0-0"}, stream=True, timeout=(5, 10)) as r:
+                return r.status_code in (200, 206)
+        except requests.exceptions.RequestException:
             return False
-        
-        # 选择下载源
-        if use_mirror and model_name in self.mirror_urls:
-            url = self.mirror_urls[model_name]
+    
+    def _race_mirrors(self, urls):
+        """并发探测所有镜像，返回重排后的 URL 列表：最先响应成功的排在最前
+
+        不等待较慢的探测结束，不可达的镜像不会拖住下载；尚未开始的探测直接取消。
+        """
+        if len(urls) < 2:
+            return list(urls)
+        pool = ThreadPoolExecutor(max_workers=len(urls))
+        futures = {pool.submit(self._probe, url): url for url in urls}
+        winner = None
+        try:
+            for fut in as_completed(futures):
+                if fut.result():
+                    winner = futures[fut]
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        if winner is None:
+            return list(urls)
+        return [winner] + [u for u in urls if u != winner]
+    
+    def _fetch(self, model_name, url, part_path, response=None):
+        """从单个 URL 下载到 .part（支持续传）并校验，返回响应头；失败时抛出异常
+
+        response 为条件请求已拿到的完整响应时直接使用，从头写入。
+        """
+        if response is None:
+            # 限流（429）及网关错误的退避重试由 session 的 Retry 处理
+            response, offset = _get_resumable(self.session, url, part_path)
         else:
-            url = self.model_urls[model_name]
+            _check_response(response)
+            offset = 0
+            _save_part_meta(part_path, url, response.headers)
+        if offset:
+            _log(f"   [{model_name}] 从 {offset} 字节处续传")
+        
+        remaining = int(response.headers.get('content-length', 0))
+        total_size = offset + remaining if remaining else 0
+        
+        # 直接从底层连接读取（跳过 iter_content 的生成器），由 copyfileobj 按块写入；
+        # 中途出错时也关闭响应，读了一半的连接不能回到连接池
+        raw = response.raw
+        raw.decode_content = True
+        with response, _open_part(part_path, offset) as f, _ProgressReader(raw, model_name, total_size, offset) as src:
+            _copy_stream(src, f, remaining)
+        _verify_download(part_path, total_size, self.checksums.get(model_name))
+        return response.headers
+    
+    @property
+    def model_urls(self):
+        """兼容旧接口：{模型名: 官方 URL}（只读，增改地址请修改 mirrors）"""
+        return {name: urls[-1] for name, urls in self.mirrors.items()}
+    
+    @property
+    def mirror_urls(self):
+        """兼容旧接口：{模型名: 首选镜像 URL}，只有官方源的模型不在其中（只读）"""
+        return {name: urls[0] for name, urls in self.mirrors.items() if len(urls) > 1}
+    
+    def fetch_model(self, model_name, use_mirror=False, refresh=False):
+        """下载指定的YOLO模型，成功返回文件路径，失败返回 None
+
+        use_mirror 为 True 时先并发探测所有地址，从最先响应的开始依次尝试；为 False 时只用官方源。
+        refresh 为 True 时已存在的模型也会向服务器确认是否有更新（If-None-Match/If-Modified-Since），
+        未变化（304）则不下载正文。
+        """
+        if model_name not in self.mirrors:
+            _log(f"❌ 不支持的模型: {model_name}")
+            _log(f"✅ 支持的模型: {list(self.mirrors.keys())}")
+            return None
         
         model_path = self.models_dir / f"{model_name}.pt"
         
-        if model_path.exists():
-            print(f"✅ {model_name} 已存在: {model_path}")
-            return True
+        # (url, 响应) 列表：条件请求拿到的新版本排在最前，其余地址作为备选
+        attempts = []
+        if model_path.name in self._scan():
+            if not refresh:
+                _log(f"✅ {model_name} 已存在: {model_path}")
+                return str(model_path)
+            revalidated = self._revalidate(model_name, model_path)
+            if revalidated is None:
+                _log(f"⚠️  {model_name} 无法确认是否有更新，保留现有文件: {model_path}")
+                return str(model_path)
+            url, response, unchanged = revalidated
+            if unchanged:
+                _log(f"✅ {model_name} 未变化，跳过下载: {model_path}")
+                return str(model_path)
+            attempts.append((url, response))
         
-        print(f"⬇️  下载 {model_name}...")
-        print(f"   来源: {url}")
+        _log(f"⬇️  下载 {model_name}...")
         
-        try:
-            # 下载模型
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
+        # 先写入 .part，完整下载后再改名；中断后保留 .part，下次（或换镜像时）从断点续传
+        part_path = model_path.with_suffix(model_path.suffix + ".part")
+        urls = self.mirrors[model_name]
+        urls = urls if use_mirror else urls[-1:]
+        # 有可续传的 .part 时先回到它的来源地址，否则换个镜像就得从头下载；没有时并发探测选最快的
+        resume_url = (_load_part_meta(part_path) or {}).get("url") if part_path.exists() else None
+        if resume_url in urls:
+            urls = [resume_url] + [u for u in urls if u != resume_url]
+        elif use_mirror:
+            urls = self._race_mirrors(urls)
+        attempts += [(url, None) for url in urls]
+        import requests
+        from urllib3.exceptions import HTTPError as Urllib3HTTPError
+        for i, (url, response) in enumerate(attempts):
+            _log(f"   来源 [{i+1}/{len(attempts)}]: {url}")
+            try:
+                headers = self._fetch(model_name, url, part_path, response)
+            # 直接读取 response.raw 时，传输中断抛出的是 urllib3 的异常；校验失败为 ValueError
+            except (requests.exceptions.RequestException, Urllib3HTTPError, ValueError, OSError) as e:
+                _log(f"   ❌ 下载失败: {e}")
+                continue
+            os.replace(part_path, model_path)
+            _part_meta_path(part_path).unlink(missing_ok=True)
+            self._scan_cache = None
+            self._record_etag(model_name, url, headers)
             
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(model_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # 显示下载进度
-                        if total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            print(f"  进度: {percent:.1f}% ({downloaded}/{total_size} bytes)", end='\r')
-            
-            print(f"\n✅ {model_name} 下载完成: {model_path}")
-            print(f"   大小: {model_path.stat().st_size / (1024*1024):.1f} MB")
-            return True
-            
-        except Exception as e:
-            print(f"❌ 下载失败: {e}")
-            # 清理失败的文件
-            if model_path.exists():
-                model_path.unlink()
-            return False
+            _log(f"\n✅ {model_name} 下载完成: {model_path}")
+            _log(f"   大小: {model_path.stat().st_size / (1024*1024):.1f} MB")
+            return str(model_path)
+        
+        _log(f"❌ {model_name} 所有下载源均失败")
+        if part_path.exists():
+            _log(f"   已保留未完成的文件，下次运行将续传: {part_path}")
+        return None
+    
+    def close(self):
+        """关闭连接池"""
+        if self._session is not None:
+            self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
     
     def list_models(self):
         """列出可用的模型"""
         print("📦 可用YOLO模型:")
-        for model_name in self.model_urls.keys():
-            model_path = self.models_dir / f"{model_name}.pt"
-            status = "✅ 已下载" if model_path.exists() else "❌ 未下载"
+        scan = self._scan()
+        for model_name in self.mirrors.keys():
+            status = "✅ 已下载" if f"{model_name}.pt" in scan else "❌ 未下载"
             print(f"   {model_name}: {status}")
     
-    def download_all(self, use_mirror=False):
-        """下载所有模型"""
+    def download_model(self, model_name, use_mirror=False, refresh=False):
+        """下载指定的YOLO模型，返回是否成功（需要文件路径时用 fetch_model）"""
+        return self.fetch_model(model_name, use_mirror, refresh) is not None
+    
+    def fetch_all(self, use_mirror=False, max_workers=None, refresh=False):
+        """并行下载所有模型（各文件相互独立，耗时取决于最慢的一个而非总和），返回 {模型名: 路径或 None}
+
+        max_workers 默认取构造时的 max_parallel。
+        """
         print("🚀 开始下载所有YOLO模型...")
-        success_count = 0
+        results = {}
         
-        for model_name in self.model_urls.keys():
-            if self.download_model(model_name, use_mirror):
-                success_count += 1
-            print()  # 空行分隔
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_parallel) as ex:
+            futures = {ex.submit(self.fetch_model, name, use_mirror, refresh): name for name in self.mirrors}
+            for fut in as_completed(futures):
+                try:
+                    results[futures[fut]] = fut.result()
+                except Exception as e:
+                    _log(f"❌ {futures[fut]} 下载异常: {e}")
+                    results[futures[fut]] = None
         
-        print(f"📊 下载完成: {success_count}/{len(self.model_urls)} 成功")
-        return success_count > 0
+        success_count = sum(1 for path in results.values() if path)
+        print(f"📊 下载完成: {success_count}/{len(self.mirrors)} 成功")
+        return results
+    
+    def download_all(self, use_mirror=False, max_workers=None, refresh=False):
+        """并行下载所有模型，至少一个成功时返回 True（需要逐个结果时用 fetch_all）"""
+        return any(self.fetch_all(use_mirror, max_workers, refresh).values())
 
 def main():
     """主函数"""
@@ -108,6 +555,8 @@ def main():
     print("=" * 50)
     
     downloader = ModelDownloader()
+    # --refresh：已下载的模型也向服务器确认是否有更新
+    refresh = "--refresh" in sys.argv[1:]
     
     # 列出当前模型状态
     downloader.list_models()
@@ -124,11 +573,11 @@ def main():
     choice = input("\n请输入选项 (1-5): ").strip()
     
     if choice == "1":
-        downloader.download_model("yolov5s", use_mirror=True)
+        downloader.download_model("yolov5s", use_mirror=True, refresh=refresh)
     elif choice == "2":
-        downloader.download_model("yolov8n", use_mirror=True)
+        downloader.download_model("yolov8n", use_mirror=True, refresh=refresh)
     elif choice == "3":
-        downloader.download_all(use_mirror=True)
+        downloader.download_all(use_mirror=True, refresh=refresh)
     elif choice == "4":
         downloader.list_models()
     elif choice == "5":
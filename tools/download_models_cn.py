@@ -3,93 +3,99 @@
 国内镜像源模型下载工具
 使用国内镜像加速模型下载
 """
-import os
-import requests
-from pathlib import Path
+from typing import Final
+
+try:
+    from tools.download_models import ModelDownloader
+except ImportError:
+    # 直接在 tools/ 目录下运行脚本时
+    from download_models import ModelDownloader
+
+# 国内镜像源配置：官方源放在最后作为兜底
+CN_MIRRORS: Final = {
+    'yolov5s': [
+        'https://mirror.sjtu.edu.cn/pytorch/models/yolov5s.pt',
+        'https://mirrors.bfsu.edu.cn/pytorch/models/yolov5s.pt',
+        'https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5s.pt'
+    ],
+    'yolov5m': [
+        'https://mirror.sjtu.edu.cn/pytorch/models/yolov5m.pt',
+        'https://mirrors.bfsu.edu.cn/pytorch/models/yolov5m.pt',
+        'https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5m.pt'
+    ],
+    'yolov5l': [
+        'https://mirror.sjtu.edu.cn/pytorch/models/yolov5l.pt',
+        'https://mirrors.bfsu.edu.cn/pytorch/models/yolov5l.pt',
+        'https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5l.pt'
+    ]
+}
+
 
 class ChinaModelDownloader:
-    def __init__(self):
-        self.models_dir = Path("resources/models")
-        self.models_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 国内镜像源配置
-        self.mirror_sources = {
-            'yolov5s': [
-                'https://mirror.sjtu.edu.cn/pytorch/models/yolov5s.pt',
-                'https://mirrors.bfsu.edu.cn/pytorch/models/yolov5s.pt',
-                'https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5s.pt'
-            ],
-            'yolov5m': [
-                'https://mirror.sjtu.edu.cn/pytorch/models/yolov5m.pt',
-                'https://mirrors.bfsu.edu.cn/pytorch/models/yolov5m.pt',
-                'https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5m.pt'
-            ],
-            'yolov5l': [
-                'https://mirror.sjtu.edu.cn/pytorch/models/yolov5l.pt',
-                'https://mirrors.bfsu.edu.cn/pytorch/models/yolov5l.pt',
-                'https://github.com/ultralytics/yolov5/releases/download/v6.0/yolov5l.pt'
-            ]
-        }
-    
-    def download_model(self, model_name):
-        """下载模型文件"""
-        if model_name not in self.mirror_sources:
-            print(f"❌ 不支持的模型: {model_name}")
-            return None
-        
-        model_path = self.models_dir / f"{model_name}.pt"
-        
-        # 如果模型已存在，直接返回路径
-        if model_path.exists():
-            print(f"✅ 模型已存在: {model_path}")
-            return str(model_path)
-        
-        print(f"⬇️  下载 {model_name}...")
-        
-        # 尝试所有镜像源
-        for i, url in enumerate(self.mirror_sources[model_name]):
-            source_name = "官方源" if "github.com" in url else "国内镜像"
-            print(f"   来源 [{i+1}/{len(self.mirror_sources[model_name])}]: {source_name}")
-            
-            try:
-                response = requests.get(url, stream=True, timeout=30)
-                response.raise_for_status()
-                
-                # 下载文件
-                with open(model_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                print(f"✅ 下载成功: {model_path}")
-                return str(model_path)
-                
-            except requests.exceptions.RequestException as e:
-                print(f"   ❌ 下载失败: {e}")
-                continue
-        
-        print(f"❌ 所有镜像源下载失败")
-        return None
-
-# 导出函数
-def download_yolov5s():
-    """下载YOLOv5s模型"""
-    downloader = ChinaModelDownloader()
-    return downloader.download_model("yolov5s")
-
-def download_yolov5m():
-    """下载YOLOv5m模型"""
-    downloader = ChinaModelDownloader()
-    return downloader.download_model("yolov5m")
-
-def download_yolov5l():
-    """下载YOLOv5l模型"""
-    downloader = ChinaModelDownloader()
-    return downloader.download_model("yolov5l")
+    """旧版国内镜像下载接口：download_model 返回文件路径而非 bool
+
+    内部持有一个使用 CN_MIRRORS 的 ModelDownloader，不继承它，
+    以免改变 ModelDownloader.download_model/download_all 的签名与返回值约定。
+    新代码请直接使用 ModelDownloader(mirrors=CN_MIRRORS)。
+    """
+
+    def __init__(self, max_parallel=4, checksums=None):
+        self.downloader = ModelDownloader(mirrors=CN_MIRRORS, max_parallel=max_parallel, checksums=checksums)
+
+    @property
+    def mirrors(self):
+        return self.downloader.mirrors
+
+    @mirrors.setter
+    def mirrors(self, value):
+        self.downloader.mirrors = value
+
+    # 兼容旧接口：即 mirrors
+    mirror_sources = mirrors
+
+    @property
+    def models_dir(self):
+        return self.downloader.models_dir
+
+    @models_dir.setter
+    def models_dir(self, value):
+        self.downloader.models_dir = value
+
+    def download_model(self, model_name, refresh=False):
+        """依次尝试各镜像下载模型，成功返回文件路径，失败返回 None"""
+        return self.downloader.fetch_model(model_name, use_mirror=True, refresh=refresh)
+
+    def download_all(self, max_workers=4):
+        """并行下载所有模型，返回 {模型名: 路径或 None}"""
+        return self.downloader.fetch_all(use_mirror=True, max_workers=max_workers)
+
+    def close(self):
+        self.downloader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# 导出函数：download_yolov5s / download_yolov5m / download_yolov5l，按镜像表生成
+def _make_download_func(model_name):
+    def download():
+        with ChinaModelDownloader() as downloader:
+            return downloader.download_model(model_name)
+    download.__name__ = download.__qualname__ = f"download_{model_name}"
+    download.__doc__ = f"下载YOLO{model_name[4:]}模型"
+    return download
+
+for _name in CN_MIRRORS:
+    globals()[f"download_{_name}"] = _make_download_func(_name)
+del _name
 
 if __name__ == "__main__":
     # 测试下载
-    downloader = ChinaModelDownloader()
-    model_path = downloader.download_model("yolov5s")
+    with ChinaModelDownloader() as downloader:
+        model_path = downloader.download_model("yolov5s")
     if model_path:
         print(f"测试成功: {model_path}")
     else: